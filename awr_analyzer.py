@@ -1,1676 +1,1086 @@
-import plotly.offline as py
-import plotly.graph_objs as go
-import sys
+import numpy as np
+import argparse
+import array
+import base64
+import bisect
+import bz2
+import collections
+import csv
+import functools
+import gzip
+import hashlib
+import heapq
+import json
+import locale
+import lzma
+import mmap
+import multiprocessing
 import os
 import re
+import sys
+import tarfile
+import time
+import zipfile
 from datetime import datetime
-from plotly.subplots import make_subplots
+
+REPORT_BUFFER_SIZE = 64 * 1024
+
+# Bump whenever a change to the parser changes the records it produces, so records cached by an older
+# version are parsed again.
+PARSER_VERSION = 4
+REPORT_ENCODING = locale.getpreferredencoding(False)
+
+# Compressed reports are decompressed while they are read. Every matching report inside an archive is read
+# from the archive in place.
+COMPRESSED_OPENERS = ((".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open))
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+
+# Every line that can open or close a section in ReportParser contains one of these strings.
+SECTION_HEADERS = ("Begin Snap:", "End Snap:", "Load Profile", "Instance Efficiency",
+                   "Wait Classes by Total Wait Time", "Foreground Wait Class", "Foreground Wait Events",
+                   "Wait Event Histogram", "Host CPU", "Time Model", "Operating System Statistics",
+                   "Instance Activity Stats", "IOStat", "IO Stat", "SQL ordered by")
+SECTION_HEADER_RE = re.compile("|".join(re.escape(header) for header in SECTION_HEADERS))
+SECTION_HEADER_BYTES_RE = re.compile(SECTION_HEADER_RE.pattern.encode("ascii"))
+
+# the report header (DB version etc.) is always read line by line. Its blocks are column titles, a dashed line and
+# a line of values, read by the titles over their columns: the blocks differ between releases (12.2+ moved the
+# instance into a block of its own)
+HEAD_LINES = 20
+HEAD_FIELDS = {"DB Name": "db_name", "DB Id": "dbid", "Instance": "instance", "Inst Num": "inst_num",
+               "Release": "db_version"}
+
+TIME_MODEL_STATS = ("parse time elapsed", "sql execute elapsed time", "hard parse elapsed time",
+                    "failed parse elapsed time", "connection management call elapsed time",
+                    "hard parse (sharing criteria) elapsed time", "PL/SQL execution elapsed time",
+                    "PL/SQL compilation elapsed time", "sequence load elapsed time",
+                    "hard parse (bind mismatch) elapsed time", "Java execution elapsed time", "DB time")
+INSTANCE_STATS = ("temp space allocated (bytes)", "index fast full scans (direct re", "index fast full scans (full)",
+                  "index fetch by key", "index scans kdiixs", "sorts (disk)", "table fetch by rowid",
+                  "table scans (direct read)", "table scans (long tables)", "table scans (short tables)",
+                  "queries parallelized", "cell scans", "user calls", "user commits", "user commits/calls")
+
+# Row shapes, tokenised only by the handler of the section they belong to. A statistic row starts with the
+# statistic name; a time model row has the time next, an instance activity row the total and then the value
+# per second.
+LONG_WORDS_RE = re.compile(r"\s{2,}")
+TIME_MODEL_ROW_RE = re.compile(r"(%s)\S*\s+(\S+)" % "|".join(re.escape(stat) for stat in TIME_MODEL_STATS))
+INSTANCE_STATS_ROW_RE = re.compile(r"(%s)\S*\s+\S+\s+(\S+)" % "|".join(re.escape(stat)
+                                                                          for stat in INSTANCE_STATS))
+
+# A numeric report cell: optional thousands separators and a unit suffix. Time suffixes are converted to
+# milliseconds, the unit of the wait averages. Anything else, including the "####" Oracle prints when a value
+# does not fit its column, is not a number.
+NUMBER_RE = re.compile(r"\s*([-+]?(?=\.?\d)[\d,]*\.?\d*(?:[eE][-+]?\d+)?)(K|M|G|T|ms|us|s)?\s*$")
+NUMBER_SUFFIXES = {"K": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "s": 1e3, "ms": 1, "us": 1e-3}
+
+# Layout of the report sections whose format changed between releases. A header is a (text, offset) pair,
+# the text has to start at that offset of the line or, with offset None, anywhere in it. In wait class rows
+# the given number of words separates the class name from the wait time; releases without the wait class
+# section add up the wait time column of the events instead. The Host CPU row has User, System and WIO %
+# in consecutive columns starting at the column given for its width (None: any other width); before 11.2.0.4
+# the CPU count is a word of the section header instead of a column.
+PROFILE_11G = {"name": "10g/11.1",
+               "wait_class_start": ("Foreground Wait Events", None),
+               "wait_class_end": ("Wait Event Histogram", None),
+               "wait_class_time_word": None,
+               "wait_event_time_column": 3,
+               "host_cpu_min_columns": 6,
+               "host_cpu_user_column": {None: 3},
+               "host_cpu_count_column": {},
+               "host_cpu_count_word": 3,
+               "load_profile_plural": True}
+PROFILE_11203 = dict(PROFILE_11G, name="11.2.0.3",
+                     wait_class_start=("Foreground Wait Class", 0),
+                     wait_class_end=("Foreground Wait Events", 1),
+                     wait_class_time_word=2,
+                     wait_event_time_column=None)
+PROFILE_11204 = dict(PROFILE_11203, name="11.2.0.4",
+                     wait_class_start=("Wait Classes by Total Wait Time", 0),
+                     wait_class_end=None,
+                     wait_class_time_word=1,
+                     host_cpu_min_columns=9,
+                     host_cpu_user_column={10: 6, None: 5},
+                     host_cpu_count_column={10: 1},
+                     host_cpu_count_word=None,
+                     load_profile_plural=False)
+
+# Parser profiles by the first release they apply to.
+PARSER_PROFILES = (((), PROFILE_11G),
+                   ((11, 2, 0, 3), PROFILE_11203),
+                   ((11, 2, 0, 4), PROFILE_11204),
+                   ((12,), dict(PROFILE_11204, name="12c+")))
+PARSER_PROFILE_VERSIONS = [version for version, profile in PARSER_PROFILES]
+
+
+def parse_version(version):
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def get_parser_profile(version):
+    return PARSER_PROFILES[bisect.bisect_right(PARSER_PROFILE_VERSIONS, version) - 1][1]
+
+
+# Wait classes of the event names, per Oracle release: every release lists only the events it added or moved to
+# another class, in V$EVENT_NAME order. A report is looked up in the events of all releases up to its own, the
+# first release also covers the older ones. import_event_names adds a release from a V$EVENT_NAME export.
+EVENT_CLASSES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "awr_event_classes.json")
+
+
+@functools.lru_cache(maxsize=None)
+def load_event_classes(path=EVENT_CLASSES_FILE):
+    # Returns ((version, release, ((event name, wait class), ...)), ...) in release order
+    with open(path) as event_classes_file:
+        releases = json.load(event_classes_file)["releases"]
+    return tuple(sorted((parse_version(release), release, tuple(tuple(event) for event in events))
+                        for release, events in releases.items()))
+
+
+def save_event_classes(releases, path=EVENT_CLASSES_FILE):
+    # releases is {release: [(event name, wait class), ...]}, written one event per line
+    lines = []
+    for release in sorted(releases, key=parse_version):
+        lines.append("    %s: [\n%s\n    ]" % (json.dumps(release),
+                                                ",\n".join("      " + json.dumps(list(event))
+                                                           for event in releases[release])))
+    with open(path, "w") as event_classes_file:
+        event_classes_file.write('{\n  "format": 1,\n  "releases": {\n' + ",\n".join(lines) + "\n  }\n}\n")
+
+
+def import_event_names(csv_path, release, path=EVENT_CLASSES_FILE):
+    # Adds (or replaces) release from a CSV export of V$EVENT_NAME with a header line, keeping only the events
+    # that are new or in another class than in the releases before it. Returns the number of events kept.
+    with open(csv_path, newline="") as csv_file:
+        rows = [dict((column.strip().upper(), value.strip()) for column, value in row.items() if column)
+                for row in csv.DictReader(csv_file)]
+    rows.sort(key=lambda row: int(row.get("EVENT#") or 0))
+
+    releases = dict((name, list(events)) for version, name, events in load_event_classes(path) if name != release)
+    event_classes = {}
+    for events in (releases[name] for name in sorted(releases, key=parse_version)
+                   if parse_version(name) < parse_version(release)):
+        event_classes.update(events)
+    releases[release] = [(row["NAME"], row["WAIT_CLASS"]) for row in rows
+                         if event_classes.get(row["NAME"]) != row["WAIT_CLASS"]]
+
+    save_event_classes(releases, path)
+    load_event_classes.cache_clear()
+    get_event_catalog.cache_clear()
+    get_release_catalog.cache_clear()
+    return len(releases[release])
+
+
+class EventCatalog(object):
+    # Event names are truncated in the report, so the class is looked up by prefix. Names sharing a prefix are
+    # adjacent in event_names_sorted; of those the one listed first wins.
+    def __init__(self, events):
+        self.event_class_name = {}
+        for event_name, class_name in events:
+            self.event_class_name[event_name] = class_name
+        self.event_names_sorted = sorted(self.event_class_name)
+        event_names_position = {event_name: i for i, event_name in enumerate(self.event_class_name)}
+        self.event_names_order = [event_names_position[event_name] for event_name in self.event_names_sorted]
+        self.event_class_name_memo = {}
+
+    def get_class_name(self, event_name_short):
+        class_name = self.event_class_name_memo.get(event_name_short)
+        if class_name is None:
+            first = bisect.bisect_left(self.event_names_sorted, event_name_short)
+            last = first
+            while last < len(self.event_names_sorted) \
+                    and self.event_names_sorted[last].startswith(event_name_short):
+                last += 1
+
+            if first < last:
+                event_name = self.event_names_sorted[min(range(first, last), key=self.event_names_order.__getitem__)]
+                class_name = self.event_class_name[event_name]
+            else:
+                class_name = "NONE"
+            self.event_class_name_memo[event_name_short] = class_name
+
+        return class_name
+
+
+@functools.lru_cache(maxsize=None)
+def get_event_catalog(version):
+    # One catalogue per process for each set of releases, shared by all reports and analyzers
+    releases = load_event_classes()
+    count = max(1, bisect.bisect_right([release_version for release_version, name, events in releases], version))
+    return get_release_catalog(count)
+
+
+@functools.lru_cache(maxsize=None)
+def get_release_catalog(count):
+    # the catalogue of the first count releases
+    return EventCatalog(event for version, name, events in load_event_classes()[:count] for event in events)
+
+
+def is_header(report_line, header):
+    text, offset = header
+    if offset is None:
+        return report_line.find(text) >= 0
+    return report_line.startswith(text, offset)
+
+
+# Report sections each chart layout needs. Reading a report stops as soon as all sections of its plan are
+# complete, so the rest of the file (SQL text, segment statistics, init.ora etc.) is never read.
+PARSE_PLANS = {"FULL": ("snap", "load_profile", "wait_class", "host_cpu", "time_model", "instance_stats",
+                        "top_sql"),
+               "SQL": ("snap", "load_profile", "wait_class", "host_cpu", "top_sql"),
+               "IO": ("snap", "load_profile", "wait_class", "host_cpu", "instance_stats")}
+
+# The snapshot catalogue only needs the report header, which ends with the End Snap line
+CATALOG_PLAN = ("snap",)
+CATALOG_FIELDS = ("db_name", "dbid", "instance", "inst_num", "db_version", "begin_snap_id", "begin_time",
+                  "end_snap_id", "end_time")
+SNAP_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+EPOCH = datetime(1970, 1, 1)
+
+NAN = float("nan")
+NAN_ROW = array.array("d", [NAN])
+
+# Snapshots are identified by the Begin Snap time (seconds since the epoch, report local time), the snap id and
+# the database and instance the report is for, so they sort and compare as integers. Reports of different
+# databases or instances starting at the same time are different snapshots.
+SnapKey = collections.namedtuple("SnapKey", ("time", "snap_id", "dbid", "inst_num"))
+
+
+def parse_int(cell):
+    return int(cell) if cell and cell.isdigit() else 0
+
+
+def snap_key(snap):
+    begin_time = datetime.strptime(snap["begin_time"], SNAP_TIME_FORMAT)
+    return SnapKey(int((begin_time - EPOCH).total_seconds()), parse_int(snap["begin_snap_id"]),
+                   parse_int(snap["dbid"]), parse_int(snap["inst_num"]))
+
+
+def snap_labels(keys):
+    # the labels the charts show for the snapshots, e.g. 20171028:10:00 (1234)
+    times = np.array([key.time for key in keys], dtype="datetime64[s]")
+    return [minute[0:4] + minute[5:7] + minute[8:10] + ":" + minute[11:16] + " (" + str(key.snap_id) + ")"
+            for minute, key in zip(np.datetime_as_string(times, unit="m").tolist(), keys)]
+
+
+def parse_number(cell):
+    # most cells are plain decimals
+    plain = cell.replace(",", "")
+    if plain.replace(".", "", 1).isdecimal():
+        return float(plain)
+
+    number = NUMBER_RE.match(cell)
+    if number is None:
+        return None
+
+    value = float(number.group(1).replace(",", ""))
+    if number.group(2):
+        value *= NUMBER_SUFFIXES[number.group(2)]
+    return value
+
+
+def parse_sessions(report_line_words):
+    # the Sessions cell of a Begin/End Snap line, None when it is missing or does not fit the column (####)
+    sessions = parse_number(report_line_words[5]) if len(report_line_words) > 5 else None
+    return None if sessions is None else int(sessions)
+
+
+class ReportReader(object):
+    # Iterates over the lines of a memory-mapped report as (line, header) pairs, where header is the first of
+    # SECTION_HEADERS found in the line or None. skip_to_next_section() lets the parser jump straight to the
+    # next line containing a section header instead of reading the lines in between. The next header is found
+    # by running SECTION_HEADER_BYTES_RE over the map; the scan only goes as far as the parser reads, so a report
+    # whose sections are complete early is not scanned to the end.
+    # Files that cannot be mapped (empty, pipes) and report_file, a binary stream of a compressed report or an
+    # archive member, are streamed, matched line by line and nothing is skipped.
+    def __init__(self, path, report_file=None):
+        self.path = path
+        self.report_map = None
+        self.next_header_offset = -1
+        self.next_header = None
+        self.report_file = report_file
+        if report_file is not None:
+            return
+
+        self.report_file = open(path, "rb")
+        try:
+            self.report_map = mmap.mmap(self.report_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            pass
+
+    def find_next_header(self, pos):
+        # finds the first line at or after pos (a line start) containing a section header
+        header = SECTION_HEADER_BYTES_RE.search(self.report_map, pos)
+        if header is None:
+            self.next_header_offset = len(self.report_map)
+            self.next_header = None
+        else:
+            self.next_header_offset = self.report_map.rfind(b"\n", pos, header.start()) + 1 or pos
+            self.next_header = header.group().decode("ascii")
+
+    def __iter__(self):
+        try:
+            if self.report_map is None:
+                for report_line in self.report_file:
+                    if report_line.endswith(b"\r\n"):
+                        report_line = report_line[:-2] + b"\n"
+                    report_line = report_line.decode(REPORT_ENCODING, "replace")
+                    header = SECTION_HEADER_RE.search(report_line)
+                    yield report_line, header.group() if header else None
+                return
+
+            pos = self.report_map.tell()
+            report_line = self.report_map.readline()
+            while report_line:
+                if pos > self.next_header_offset:
+                    self.find_next_header(pos)
+                if report_line.endswith(b"\r\n"):
+                    report_line = report_line[:-2] + b"\n"
+                yield (report_line.decode(REPORT_ENCODING, "replace"),
+                       self.next_header if pos == self.next_header_offset else None)
+                pos = self.report_map.tell()
+                report_line = self.report_map.readline()
+        finally:
+            self.close()
+
+    def skip_to_next_section(self):
+        if self.report_map is not None:
+            pos = self.report_map.tell()
+            if pos > self.next_header_offset:
+                self.find_next_header(pos)
+            self.report_map.seek(self.next_header_offset)
+
+    def close(self):
+        if self.report_map is not None:
+            self.report_map.close()
+            self.report_map = None
+        self.report_file.close()
+
+
+class ReportParser(object):
+    # Parses one report into a self-contained snapshot record. A line containing a section header is
+    # dispatched to the handlers HEADER_HANDLERS lists for that header, any other line only to the row
+    # handler of each open section, so the cost of a line does not grow with the number of known sections.
+    # Handlers return True when the line was theirs. When several handlers apply to a line (a header line
+    # inside an open section, or two open sections) they are tried in HANDLER_ORDER.
+    HANDLER_ORDER = ("begin_snap", "time_model_start", "instance_stats_start", "time_model_end",
+                     "instance_stats_end", "time_model_row", "instance_stats_row", "end_snap", "load_profile_start",
+                     "wait_class_start", "wait_class_end", "host_cpu_start", "host_cpu_row",
+                     "load_profile_row", "load_profile_end", "wait_class_row", "top_sql_start",
+                     "top_sql_row", "top_sql_end")
+
+    HEADER_HANDLERS = {"Begin Snap:": ("begin_snap",),
+                       "End Snap:": ("end_snap",),
+                       "Load Profile": ("load_profile_start",),
+                       "Instance Efficiency": ("load_profile_end",),
+                       "Wait Classes by Total Wait Time": ("wait_class_start",),
+                       "Foreground Wait Class": ("wait_class_start",),
+                       "Foreground Wait Events": ("time_model_end", "wait_class_start", "wait_class_end"),
+                       "Wait Event Histogram": ("wait_class_end",),
+                       "Host CPU": ("host_cpu_start",),
+                       "Time Model": ("time_model_start",),
+                       "Operating System Statistics": ("time_model_end",),
+                       "Instance Activity Stats": ("instance_stats_start",),
+                       "IOStat": ("instance_stats_end",),
+                       "IO Stat": ("instance_stats_end",),
+                       "SQL ordered by": ("top_sql_start", "top_sql_end")}
+
+    ROW_HANDLERS = {"time_model": "time_model_row",
+                    "instance_stats": "instance_stats_row",
+                    "host_cpu": "host_cpu_row",
+                    "load_profile": "load_profile_row",
+                    "wait_class": "wait_class_row",
+                    "top_sql": "top_sql_row"}
+
+    HANDLER_RANK = dict((handler, rank) for rank, handler in enumerate(HANDLER_ORDER))
+
+    def __init__(self, analyzer, fname, sections=None):
+        self.analyzer = analyzer
+        self.fname = fname
+        self.snap = {"date": None,
+                     "db_name": None,
+                     "dbid": None,
+                     "instance": None,
+                     "inst_num": None,
+                     "begin_snap_id": None,
+                     "begin_time": None,
+                     "end_snap_id": None,
+                     "end_time": None,
+                     "waits": {},
+                     "profile": {},
+                     "cpu": {},
+                     "sql_ela": {},
+                     "sql_ids": {},
+                     "inst_stats": {},
+                     "time_model": {},
+                     "io_avg": {},
+                     "cpu_count": None,
+                     "db_version": None}
+
+        self.open_sections = set()
+        self.row_handlers = []
+        self.pending_sections = set(sections or analyzer.sections)
+        self.top_sql_ela_ignore = False
+        self.event_class_wait_sum = {}
+        self.load_profile_elems = analyzer.load_profile_elems
+        self.db_version = "12"
+        self.profile = get_parser_profile(parse_version(self.db_version))
+        self.event_catalog = get_event_catalog(parse_version(self.db_version))
+        self.head_titles = ""
+        self.head_columns = None
+        self.line_no = 0
+        self.profile_pos = 0
+
+    def parse(self, report_file):
+        for report_line, header in report_file:
+            self.line_no += 1
+            try:
+                if self.line_no > HEAD_LINES or not self.report_head(report_line):
+                    if header is None:
+                        handlers = self.row_handlers
+                    else:
+                        handlers = sorted(self.row_handlers + [(self.HANDLER_RANK[handler], getattr(self, handler))
+                                                               for handler in self.HEADER_HANDLERS[header]])
+
+                    for rank, handler in handlers:
+                        if handler(report_line):
+                            break
+
+            except BaseException as e:
+                print(e)
+                print(report_line)
+                print(self.fname)
+                print("version = " + self.db_version)
+                raise
+
+            if not self.pending_sections:
+                break
+
+            # lines between sections never change anything, jump over them
+            if self.line_no > HEAD_LINES and not self.open_sections:
+                report_file.skip_to_next_section()
+
+        self.snap["db_version"] = self.db_version
+        return self.snap
+
+    def open_section(self, section):
+        self.open_sections.add(section)
+        self.update_row_handlers()
+
+    def close_section(self, section):
+        if section in self.open_sections:
+            self.open_sections.remove(section)
+            self.pending_sections.discard(section)
+            self.update_row_handlers()
+
+    def update_row_handlers(self):
+        self.row_handlers = sorted((self.HANDLER_RANK[self.ROW_HANDLERS[section]],
+                                    getattr(self, self.ROW_HANDLERS[section])) for section in self.open_sections)
+
+    def report_head(self, report_line):
+        if self.head_columns is not None:
+            columns, self.head_columns = self.head_columns, None
+            values = {field: report_line[start:end].strip() for field, start, end in columns}
+            version = values.pop("db_version", None)
+            self.snap.update(values)
+            if version and parse_version(version):
+                self.db_version = version
+                self.profile = get_parser_profile(parse_version(self.db_version))
+                self.event_catalog = get_event_catalog(parse_version(self.db_version))
+                if self.profile["load_profile_plural"]:
+                    self.load_profile_elems = self.analyzer.load_profile_sec + self.analyzer.load_profile_mb + \
+                                              self.analyzer.load_profile_blk_old + self.analyzer.load_profile_num
+            return True
+
+        if report_line.startswith("-"):
+            # every column spans from its dashes up to the next column
+            starts = [dashes.start() for dashes in re.finditer("-+", report_line)]
+            columns = [(HEAD_FIELDS.get(self.head_titles[start:end].strip()), start, end)
+                       for start, end in zip(starts, starts[1:] + [None])]
+            columns = [column for column in columns if column[0] is not None]
+            if columns:
+                self.head_columns = columns
+                return True
+
+        self.head_titles = report_line
+        return False
+
+    def begin_snap(self, report_line):
+        snap = self.snap
+        report_line_words = report_line.split()
+        date = datetime.strptime(report_line_words[3] + " " + report_line_words[4], "%d-%b-%y %H:%M:%S")
+        snap["begin_snap_id"] = report_line_words[2]
+        snap["begin_time"] = date.strftime(SNAP_TIME_FORMAT)
+        snap["date"] = date.strftime("%Y%m%d:%H:%M") + " (" + report_line_words[2] + ")"
+        snap["waits"] = {}
+        snap["profile"] = {}
+        snap["cpu"] = {}
+        snap["sql_ela"] = {}
+        snap["io_avg"] = {}
+        snap["inst_stats"] = dict.fromkeys(INSTANCE_STATS, 0)
+        snap["time_model"] = dict.fromkeys(TIME_MODEL_STATS, 0)
+
+        snap["profile"]["Sessions (Begin)"] = parse_sessions(report_line_words)
+        return True
+
+    def end_snap(self, report_line):
+        report_line_words = report_line.split()
+        date = datetime.strptime(report_line_words[3] + " " + report_line_words[4], "%d-%b-%y %H:%M:%S")
+        self.snap["end_snap_id"] = report_line_words[2]
+        self.snap["end_time"] = date.strftime(SNAP_TIME_FORMAT)
+        self.snap["profile"]["Sessions (End)"] = parse_sessions(report_line_words)
+        self.pending_sections.discard("snap")
+        return True
+
+    def time_model_start(self, report_line):
+        if "time_model" not in self.open_sections and (report_line.startswith("Time Model") or
+                                                       report_line[1:].startswith("Time Model")):
+            self.open_section("time_model")
+            return True
+
+        return False
+
+    def time_model_end(self, report_line):
+        if "time_model" in self.open_sections and \
+                (report_line.startswith("Foreground Wait Events") or
+                 report_line[1:].startswith("Foreground Wait Events") or
+                 report_line.startswith("Operating System Statistics")):
+            self.close_section("time_model")
+            self.close_section("wait_class")
+            return True
+
+        return False
+
+    def time_model_row(self, report_line):
+        row = TIME_MODEL_ROW_RE.match(report_line)
+        if row and row.group(1) in self.snap["time_model"]:
+            time_model_val = parse_number(row.group(2))
+            if time_model_val is not None:
+                self.snap["time_model"][row.group(1)] = time_model_val
+
+        return True
+
+    def instance_stats_start(self, report_line):
+        if "instance_stats" not in self.open_sections and \
+                (report_line.startswith("Instance Activity Stats") or
+                 report_line[1:].startswith("Instance Activity Stats")):
+            self.open_section("instance_stats")
+            return True
+
+        return False
+
+    def instance_stats_end(self, report_line):
+        if "instance_stats" in self.open_sections and (report_line.startswith("IOStat") or
+                                                       report_line.startswith("IO Stat")):
+            self.close_section("instance_stats")
+            return True
+
+        return False
+
+    def instance_stats_row(self, report_line):
+        inst_stats = self.snap["inst_stats"]
+        row = INSTANCE_STATS_ROW_RE.match(report_line)
+        inst_stats_val = parse_number(row.group(2)) if row and row.group(1) in inst_stats else None
+        if inst_stats_val is not None:
+            inst_stats[row.group(1)] = inst_stats_val
+
+        return True
+
+    def load_profile_start(self, report_line):
+        if report_line.startswith("Load Profile"):
+            self.open_section("load_profile")
+            return True
+
+        return False
+
+    def load_profile_row(self, report_line):
+        if len(LONG_WORDS_RE.split(report_line)) > 2:
+            self.profile_pos += 1
+            if self.profile_pos >= 2:
+                load_elem = report_line.split(':')[0].split('(')[0].strip()
+                load_val = parse_number(report_line.split(':')[1].split()[0])
+                if load_elem in self.load_profile_elems and load_val is not None:
+                    if load_elem.startswith("Redo size"):
+                        self.snap["profile"][load_elem] = round(load_val / 1024 / 1024, 2)
+                    else:
+                        self.snap["profile"][load_elem] = load_val
+            return True
+
+        return False
+
+    def load_profile_end(self, report_line):
+        if report_line.startswith("Instance Efficiency"):
+            self.close_section("load_profile")
+            self.profile_pos = 0
+            return True
+
+        return False
+
+    def wait_class_start(self, report_line):
+        if is_header(report_line, self.profile["wait_class_start"]):
+            self.open_section("wait_class")
+            return True
+
+        return False
+
+    def wait_class_end(self, report_line):
+        if self.profile["wait_class_end"] is not None and "wait_class" in self.open_sections \
+                and is_header(report_line, self.profile["wait_class_end"]):
+            self.close_section("wait_class")
+
+            if self.profile["wait_event_time_column"] is not None:
+                for class_name in self.analyzer.event_classes:
+                    self.snap["waits"][class_name] = self.event_class_wait_sum.get(class_name, 0)
+            return True
+
+        return False
+
+    def wait_class_row(self, report_line):
+        snap = self.snap
+        event_classes = self.analyzer.event_classes
+        time_word = self.profile["wait_class_time_word"]
+        if time_word is not None:
+            report_line_words = report_line.split()
+            if len(report_line_words) > 2 and (report_line_words[0] + " " + report_line_words[1] in event_classes) \
+                    and report_line.startswith(report_line_words[0]):
+
+                # an overflowed wait time is left out and counted as 0 like a missing class
+                wait_time = parse_number(report_line_words[2 + time_word])
+                if wait_time is not None:
+                    snap["waits"][report_line_words[0] + " " + report_line_words[1]] = wait_time
+
+                if report_line.startswith("User I/O"):
+                    snap["io_avg"]["User I/O (avg ms)"] = parse_number(report_line_words[3 + time_word])
+
+                return True
+
+            elif len(report_line_words) > 2 and (report_line_words[0] in event_classes) \
+                    and report_line.startswith(report_line_words[0]):
+
+                wait_time = parse_number(report_line_words[1 + time_word])
+                if wait_time is not None:
+                    snap["waits"][report_line_words[0]] = wait_time
+                return True
+
+            return False
+
+        time_column = self.profile["wait_event_time_column"]
+        report_line_long_words = LONG_WORDS_RE.split(report_line)
+        wait_time = parse_number(report_line_long_words[time_column]) \
+            if len(report_line_long_words) > max(time_column, 4) else None
+        if wait_time is not None:
+            class_name = self.event_catalog.get_class_name(report_line_long_words[0])
+
+            if class_name not in ("NONE", "Other", "Idle"):
+                self.event_class_wait_sum[class_name] = self.event_class_wait_sum.get(class_name, 0) + wait_time
+            return True
+
+        return False
+
+    def host_cpu_start(self, report_line):
+        self.open_section("host_cpu")
+        if self.profile["wait_class_end"] is None:
+            self.close_section("wait_class")
+        if self.profile["host_cpu_count_word"] is not None:
+            self.snap["cpu_count"] = report_line.split()[self.profile["host_cpu_count_word"]]
+
+        for class_name in self.analyzer.event_classes:
+            if self.snap["waits"].get(class_name, -1) == -1:
+                self.snap["waits"][class_name] = 0
+        return True
+
+    def host_cpu_row(self, report_line):
+        cpu = self.snap["cpu"]
+        report_line_long_words = LONG_WORDS_RE.split(report_line)
+        columns = len(report_line_long_words)
+        if columns >= self.profile["host_cpu_min_columns"] and parse_number(report_line_long_words[1]) is not None:
+            user_column = self.profile["host_cpu_user_column"]
+            user_column = user_column.get(columns, user_column[None])
+            cpu["User"] = parse_number(report_line_long_words[user_column])
+            cpu["System"] = parse_number(report_line_long_words[user_column + 1])
+            cpu["WIO"] = parse_number(report_line_long_words[user_column + 2])
+            if columns in self.profile["host_cpu_count_column"]:
+                self.snap["cpu_count"] = report_line_long_words[self.profile["host_cpu_count_column"][columns]]
+
+            self.close_section("host_cpu")
+            return True
+
+        return False
+
+    def top_sql_start(self, report_line):
+        if report_line.find("SQL ordered by Elapsed Time") >= 0 and not self.top_sql_ela_ignore:
+            self.open_section("top_sql")
+            return True
+
+        return False
+
+    def top_sql_row(self, report_line):
+        report_line_words = report_line.split()
+        sql_ela = None
+        if len(report_line_words) == 7 and len(report_line_words[6]) == 13 and report_line_words[6][0] != '-':
+            sql_ela = parse_number(report_line_words[0])
+
+        if sql_ela is not None:
+            sql_id = report_line_words[6]
+            self.snap["sql_ela"][sql_id] = sql_ela
+            if self.snap["sql_ids"].get(sql_id) is None:
+                self.snap["sql_ids"][sql_id] = sql_ela
+            else:
+                self.snap["sql_ids"][sql_id] += sql_ela
+            return True
+
+        return False
+
+    def top_sql_end(self, report_line):
+        if "top_sql" in self.open_sections and report_line.find("SQL ordered by") >= 0:
+            self.close_section("top_sql")
+            self.top_sql_ela_ignore = True
+            return True
+
+        return False
+
+
+class MetricStore(object):
+    # Snapshot records merged into one array of floats per metric. Every snapshot key gets a row number when it
+    # is first added and a later record of the same snapshot replaces it. Columns are only as long as the last row
+    # written to them, anything past the end or never written reads as NaN. Each row also keeps the names of
+    # its metrics in record order, as the series are charted (and coloured) in the order they first appear.
+    # A snapshot has only a few of the many SQL seen over a long history, so SQL columns are sparse: the rows
+    # a SQL has a value for and the values. The elapsed time of every SQL summed over all snapshots is kept in
+    # sql_ids, and in sql_snaps the number of snapshots it was summed over, so a SQL goes once they are removed.
+    GROUPS = ("waits", "profile", "cpu", "sql_ela", "inst_stats", "time_model", "io_avg")
+    SPARSE_GROUPS = ("sql_ela",)
+
+    def __init__(self):
+        self.rows = {}
+        self.row_count = 0
+        self.times = array.array("q")
+        self.elapsed = array.array("d")
+        self.columns = dict((group, {}) for group in self.GROUPS)
+        self.row_metrics = dict((group, []) for group in self.GROUPS)
+        self.sql_ids = {}
+        self.sql_snaps = {}
+
+    def add(self, snap):
+        key = snap_key(snap)
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = self.row_count
+            self.row_count += 1
+            self.times.append(key.time)
+            self.elapsed.append(NAN)
+            for group in self.GROUPS:
+                self.row_metrics[group].append(())
+        else:
+            self.clear(row)
+
+        if snap["begin_time"] is not None and snap["end_time"] is not None:
+            self.elapsed[row] = (datetime.strptime(snap["end_time"], SNAP_TIME_FORMAT) -
+                                 datetime.strptime(snap["begin_time"], SNAP_TIME_FORMAT)).total_seconds()
+
+        for group in self.GROUPS:
+            columns = self.columns[group]
+            if group in self.SPARSE_GROUPS:
+                for metric, value in snap[group].items():
+                    column = columns.get(metric)
+                    if column is None:
+                        column = columns[sys.intern(metric)] = (array.array("q"), array.array("d"))
+                    column[0].append(row)
+                    column[1].append(NAN if value is None else value)
+            else:
+                for metric, value in snap[group].items():
+                    column = columns.get(metric)
+                    if column is None:
+                        column = columns[sys.intern(metric)] = array.array("d")
+                    if len(column) <= row:
+                        column.extend(NAN_ROW * (row + 1 - len(column)))
+                    column[row] = NAN if value is None else value
+
+            # consecutive snapshots mostly have the same metrics in the same order, share one tuple then
+            metrics = tuple(snap[group])
+            if row and metrics == self.row_metrics[group][row - 1]:
+                metrics = self.row_metrics[group][row - 1]
+            else:
+                metrics = tuple(sys.intern(metric) for metric in metrics)
+            self.row_metrics[group][row] = metrics
+
+        for sqlid in snap["sql_ids"]:
+            if self.sql_ids.get(sqlid) is None:
+                self.sql_ids[sqlid] = snap["sql_ids"][sqlid]
+                self.sql_snaps[sqlid] = 1
+            else:
+                self.sql_ids[sqlid] += snap["sql_ids"][sqlid]
+                self.sql_snaps[sqlid] += 1
+
+    def remove(self, snap):
+        row = self.rows.pop(snap_key(snap), None)
+        if row is not None:
+            self.clear(row)
+
+        for sqlid in snap["sql_ids"]:
+            self.sql_snaps[sqlid] -= 1
+            if self.sql_snaps[sqlid]:
+                self.sql_ids[sqlid] -= snap["sql_ids"][sqlid]
+            else:
+                del self.sql_ids[sqlid]
+                del self.sql_snaps[sqlid]
+
+    def clear(self, row):
+        for group in self.GROUPS:
+            for metric in self.row_metrics[group][row]:
+                column = self.columns[group][metric]
+                if group in self.SPARSE_GROUPS:
+                    i = column[0].index(row)
+                    del column[0][i]
+                    del column[1][i]
+                else:
+                    column[row] = NAN
+            self.row_metrics[group][row] = ()
+        self.elapsed[row] = NAN
+
+    def get_keys(self):
+        # snapshot keys in time order
+        return sorted(self.rows)
+
+    def get_rows(self, keys):
+        return np.array([self.rows[key] for key in keys], dtype=np.intp)
+
+    def get_times(self, keys):
+        # Begin Snap times in seconds since the epoch
+        return np.frombuffer(self.times, dtype=np.int64)[self.get_rows(keys)]
+
+    def get_metrics(self, group, keys):
+        # metrics in the order they appear going through the snapshots by time
+        metrics = []
+        seen = set()
+        for key in keys:
+            for metric in self.row_metrics[group][self.rows[key]]:
+                if metric not in seen:
+                    seen.add(metric)
+                    metrics.append(metric)
+            if len(seen) == len(self.columns[group]):
+                break
+
+        return metrics
+
+    def get_matrix(self, group, keys, metrics=None, missing=NAN):
+        # Returns the metrics and a snapshots x metrics matrix, with missing in place of values a snapshot does
+        # not have
+        if metrics is None:
+            metrics = self.get_metrics(group, keys)
+        rows = self.get_rows(keys)
+        matrix = np.full((len(rows), len(metrics)), NAN)
+        if group in self.SPARSE_GROUPS:
+            # position of each row in the matrix, -1 for the rows of snapshots not asked for
+            positions = np.full(self.row_count, -1, dtype=np.intp)
+            positions[rows] = np.arange(len(rows))
+            for i, metric in enumerate(metrics):
+                column = self.columns[group].get(metric)
+                if column and column[0]:
+                    column_positions = positions[np.frombuffer(column[0], dtype=np.int64)]
+                    selected = column_positions >= 0
+                    matrix[column_positions[selected], i] = np.frombuffer(column[1])[selected]
+        else:
+            for i, metric in enumerate(metrics):
+                column = self.columns[group].get(metric)
+                if column:
+                    written = rows < len(column)
+                    matrix[written, i] = np.frombuffer(column)[rows[written]]
+
+        if missing == missing:
+            matrix[np.isnan(matrix)] = missing
+        return metrics, matrix
+
+    def get_column(self, group, metric, keys):
+        return self.get_matrix(group, keys, [metric])[1][:, 0]
+
+    def get_elapsed(self, keys):
+        # snapshot interval in seconds
+        return np.frombuffer(self.elapsed)[self.get_rows(keys)]
+
+
+def divide(numerator, denominator):
+    # element-wise numerator / denominator, NaN where the denominator is 0
+    quotient = np.full(np.broadcast(numerator, denominator).shape, NAN)
+    np.divide(numerator, denominator, out=quotient, where=denominator != 0)
+    return quotient
+
+
+# --bucket sizes in seconds and where they start counting from: weeks start on Monday, 1970-01-05
+BUCKETS = {"hour": (3600, 0), "day": (86400, 0), "week": (7 * 86400, 4 * 86400)}
+BUCKET_LABEL_LENGTHS = {"hour": 16, "day": 10, "week": 10}
+
+# How the snapshots of a bucket are aggregated: times are added up, rates and percentages averaged, and of
+# the I/O latencies and session counts the peak is kept
+BUCKET_AGGREGATES = {"waits": "sum", "sql_ela": "sum", "time_model": "sum", "profile": "mean", "cpu": "mean",
+                     "inst_stats": "mean", "io_avg": "max"}
+METRIC_AGGREGATES = {"Sessions (Begin)": "max", "Sessions (End)": "max"}
+
+# Traces of more points are drawn with WebGL (Scattergl), SVG gets too slow to pan and zoom
+WEBGL_POINTS = 2000
+
+# Chart layouts: the number of subplots and their titles, and the panels, each with its row, the series it
+# charts, the y axis title and how its traces are drawn
+FILLED = {"fill": "tozeroy"}
+VIEWS = {"FULL": {"rows": 10,
+                  "titles": ("Wait Event Class & DB Time (sec)",
+                             "Load Profile (DB/CPU)",
+                             "TOP SQL by Elapsed time",
+                             "Time Model",
+                             "I/O Requests, Calls, Parses, Logons, SQL Executes, Rollbacks, Transactions, Sessions",
+                             "Host CPU Average Load",
+                             "Instance stats / s",
+                             "Load Profile (I/O R/W, Redo, SQL Workarea)",
+                             "Logical/Physical Reads/Writes, Block changes",
+                             "AVG User I/O (ms)"),
+                  "panels": ((1, "waits", "sec", FILLED),
+                             (2, "profile_sec", "sec/s", FILLED),
+                             (3, "sql_ela", "sec", {}),
+                             (4, "time_model", "sec", FILLED),
+                             (5, "profile_num", "#/s", FILLED),
+                             (6, "cpu", "%", dict(FILLED, stackgroup="cpu")),
+                             (7, "inst_stats", "#/s", FILLED),
+                             (8, "profile_mb", "MB/s", FILLED),
+                             (9, "profile_blk", "#blk/s", FILLED),
+                             (10, "io_avg", "AVG ms / snap", {})),
+                  "height": 1500},
+         "SQL": {"rows": 4,
+                 "titles": ("Wait Event Class & DB Time (sec)",
+                            "Load Profile (DB/CPU)",
+                            "TOP SQL Ela (sec)"
+                            "SQL box plots"),
+                 "panels": ((1, "waits", "sec", FILLED),
+                            (2, "profile_sec", "sec/s", FILLED),
+                            (3, "sql_ela", "sec", {})),
+                 "height": None},
+         "IO": {"rows": 8,
+                "titles": ("Wait Event Class & DB Time (sec)",
+                           "Load Profile (DB/CPU)",
+                           "AVG User I/O (ms)",
+                           "I/O Requests, Calls, Parses, Logons, SQL Executes, Rollbacks, Transactions, Sessions",
+                           "Host CPU Average Load",
+                           "Instance stats / s",
+                           "Load Profile (I/O R/W, Redo, SQL Workarea)",
+                           "Logical/Physical Reads/Writes, Block changes"),
+                "panels": ((1, "waits", "sec", FILLED),
+                           (2, "profile_sec", "sec/s", FILLED),
+                           (3, "io_avg", "AVG ms / snap", {}),
+                           (4, "profile_num", "#/s", FILLED),
+                           (5, "cpu", "%", dict(FILLED, stackgroup="cpu")),
+                           (6, "inst_stats", "#/s", FILLED),
+                           (7, "profile_mb", "MB/s", FILLED),
+                           (8, "profile_blk", "#blk/s", FILLED)),
+                "height": None}}
+
+
+def typed_array(values, rtol=1e-6):
+    # A column as a plotly.js typed array (base64 of the raw values), float32 where that keeps every value
+    # to a relative rtol, NaN stay gaps
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    with np.errstate(over="ignore"):
+        single = values.astype(np.float32)
+    if np.allclose(single, values, rtol=rtol, atol=0, equal_nan=True):
+        return {"dtype": "f4", "bdata": base64.b64encode(single).decode("ascii")}
+    return {"dtype": "f8", "bdata": base64.b64encode(values).decode("ascii")}
+
+
+def get_buckets(times, bucket):
+    # Returns the bucket labels, the times the buckets start at and the index of the first snapshot of every
+    # bucket, times must be sorted
+    size, start = BUCKETS[bucket]
+    starts = (times - start) // size * size + start
+    boundaries = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    labels = np.datetime_as_string(starts[boundaries].astype("datetime64[s]"), unit="m").tolist()
+    return [label[0:4] + label[5:7] + label[8:10] + label[10:BUCKET_LABEL_LENGTHS[bucket]].replace("T", ":")
+            for label in labels], starts[boundaries], boundaries
+
+
+def aggregate(matrix, boundaries, how, metric_hows=None):
+    # Aggregates the rows of matrix from each boundary to the next by sum, mean or max, or by the entry of
+    # metric_hows for the columns that have one. NaN are left out, a bucket of only NaN stays NaN.
+    missing = np.isnan(matrix)
+    counts = np.add.reduceat((~missing).astype(np.intp), boundaries, axis=0)
+    sums = np.add.reduceat(np.where(missing, 0, matrix), boundaries, axis=0)
+    results = {"sum": sums,
+               "mean": divide(sums, counts),
+               "max": np.fmax.reduceat(matrix, boundaries, axis=0)}
+    result = results[how].copy()
+    for j, metric_how in enumerate(metric_hows or ()):
+        if metric_how is not None:
+            result[:, j] = results[metric_how][:, j]
+    result[counts == 0] = NAN
+    return result
+
+
+def lttb(matrix, points):
+    # Largest-Triangle-Three-Buckets downsampling of every column of matrix to points rows: the first and the
+    # last row, and from each of the buckets in between the row making the largest triangle with the row
+    # taken from the bucket before and the average of the bucket after. Returns the rows taken, per column.
+    rows, columns = matrix.shape
+    if points >= rows or points < 3:
+        return np.repeat(np.arange(rows)[:, np.newaxis], columns, axis=1)
+
+    values = np.nan_to_num(matrix)
+    edges = (np.arange(points - 1) * (rows - 2) / float(points - 2)).astype(np.intp) + 1
+    edges[-1] = rows - 1
+    selected = np.empty((points, columns), dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = rows - 1
+    column_index = np.arange(columns)
+    for i in range(points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else rows
+        next_x = (end + next_end - 1) / 2.0
+        next_y = values[end:next_end].mean(axis=0)
+        previous_x = selected[i]
+        previous_y = values[previous_x, column_index]
+        x = np.arange(start, end)[:, np.newaxis]
+        areas = np.abs((previous_x - next_x) * (values[start:end] - previous_y) -
+                       (previous_x - x) * (next_y - previous_y))
+        selected[i + 1] = start + np.argmax(areas, axis=0)
+    return selected
 
 
 class AWRAnalyzer(object):
-    def __init__(self, dirname, name_pattern, param='FULL', scale=False):
+    def __init__(self, dirname, name_pattern, param='FULL', scale=False, jobs=1, timings=False, cache=None,
+                 catalog=None, time_from=None, time_to=None, dbid=None, instance=None, top_sql=20, bucket=None,
+                 max_points=None, webgl_points=WEBGL_POINTS, compact=False, plotlyjs=True):
         self.dirname = dirname
         self.name_pattern = name_pattern
         self.param = param
+        # the report sections all the views of param need
+        self.sections = tuple(section for section in PARSE_PLANS["FULL"]
+                              if any(section in PARSE_PLANS[view] for view in param.split(",")))
         self.scale = scale
+        self.jobs = jobs
+        self.timings = timings
+        self.cache = cache
+        self.cache_hits = 0
+        # time_from and time_to are in SNAP_TIME_FORMAT, reports are selected by their Begin Snap time
+        self.catalog = catalog
+        self.time_from = time_from
+        self.time_to = time_to
+        self.dbid = dbid
+        self.instance = instance
+        self.top_sql = top_sql
+        # bucket is None (every snapshot), "hour", "day" or "week", traces of more than max_points points are
+        # downsampled
+        self.bucket = bucket
+        self.max_points = max_points
+        self.webgl_points = webgl_points
+        # compact writes the series as binary typed arrays on a date axis, plotlyjs is include_plotlyjs of
+        # plotly.offline.plot: True to embed plotly.js, "directory" to share one plotly.min.js next to the charts
+        # or "cdn"
+        self.compact = compact
+        self.plotlyjs = plotlyjs
         self.cpu_count = 0
         self.event_classes = ["System I/O", "Other", "User I/O", "Configuration", "Cluster", "Concurrency",
                               "Administrative", "Application", "Network", "Commit"]
 
-        self.event_class_name = {"null event": "Other",
-                                 "pmon timer": "Idle",
-                                 "logout restrictor": "Concurrency",
-                                 "VKTM Logical Idle Wait": "Idle",
-                                 "VKTM Init Wait for GSGA": "Idle",
-                                 "IORM Scheduler Slave Idle Wait": "Idle",
-                                 "acknowledge over PGA limit": "Scheduler",
-                                 "Parameter File I/O": "User I/O",
-                                 "rdbms ipc message": "Idle",
-                                 "remote db operation": "Network",
-                                 "remote db file read": "Network",
-                                 "remote db file write": "Network",
-                                 "Disk file operations I/O": "User I/O",
-                                 "Disk file I/O Calibration": "User I/O",
-                                 "Disk file Mirror Read": "User I/O",
-                                 "Disk file Mirror/Media Repair Write": "User I/O",
-                                 "direct path sync": "User I/O",
-                                 "Clonedb bitmap file write": "System I/O",
-                                 "Datapump dump file I/O": "User I/O",
-                                 "dbms_file_transfer I/O": "User I/O",
-                                 "DG Broker configuration file I/O": "User I/O",
-                                 "Data file init write": "User I/O",
-                                 "Log file init write": "User I/O",
-                                 "Log archive I/O": "System I/O",
-                                 "RMAN backup & recovery I/O": "System I/O",
-                                 "Standby redo I/O": "System I/O",
-                                 "Network file transfer": "System I/O",
-                                 "Pluggable Database file copy": "User I/O",
-                                 "File Copy": "User I/O",
-                                 "Backup: MML initialization": "Administrative",
-                                 "Backup: MML v1 open backup piece": "Administrative",
-                                 "Backup: MML v1 read backup piece": "Administrative",
-                                 "Backup: MML v1 write backup piece": "Administrative",
-                                 "Backup: MML v1 close backup piece": "Administrative",
-                                 "Backup: MML v1 query backup piece": "Administrative",
-                                 "Backup: MML v1 delete backup piece": "Administrative",
-                                 "Backup: MML create a backup piece": "Administrative",
-                                 "Backup: MML commit backup piece": "Administrative",
-                                 "Backup: MML command to channel": "Administrative",
-                                 "Backup: MML shutdown": "Administrative",
-                                 "Backup: MML obtain textual error": "Administrative",
-                                 "Backup: MML query backup piece": "Administrative",
-                                 "Backup: MML extended initialization": "Administrative",
-                                 "Backup: MML read backup piece": "Administrative",
-                                 "Backup: MML delete backup piece": "Administrative",
-                                 "Backup: MML restore backup piece": "Administrative",
-                                 "Backup: MML write backup piece": "Administrative",
-                                 "Backup: MML proxy initialize backup": "Administrative",
-                                 "Backup: MML proxy cancel": "Administrative",
-                                 "Backup: MML proxy commit backup piece": "Administrative",
-                                 "Backup: MML proxy session end": "Administrative",
-                                 "Backup: MML datafile proxy backup?": "Administrative",
-                                 "Backup: MML datafile proxy restore?": "Administrative",
-                                 "Backup: MML proxy initialize restore": "Administrative",
-                                 "Backup: MML proxy start data movement": "Administrative",
-                                 "Backup: MML data movement done?": "Administrative",
-                                 "Backup: MML proxy prepare to start": "Administrative",
-                                 "Backup: MML obtain a direct buffer": "Administrative",
-                                 "Backup: MML release a direct buffer": "Administrative",
-                                 "Backup: MML get base address": "Administrative",
-                                 "Backup: MML query for direct buffers": "Administrative",
-                                 "OFS operation completion": "Administrative",
-                                 "OFS idle": "Idle",
-                                 "io done": "System I/O",
-                                 "i/o slave wait": "Idle",
-                                 "RMAN Disk slave I/O": "System I/O",
-                                 "RMAN Tape slave I/O": "System I/O",
-                                 "DBWR slave I/O": "System I/O",
-                                 "LGWR slave I/O": "System I/O",
-                                 "Archiver slave I/O": "System I/O",
-                                 "VKRM Idle": "Idle",
-                                 "wait for unread message on broadcast channel": "Idle",
-                                 "wait for unread message on multiple broadcast channels": "Idle",
-                                 "class slave wait": "Idle",
-                                 "PING": "Idle",
-                                 "watchdog main loop": "Idle",
-                                 "process in prespawned state": "Idle",
-                                 "BA: Performance API": "Administrative",
-                                 "File Repopulation Write": "System I/O",
-                                 "DIAG idle wait": "Idle",
-                                 "ges remote message": "Idle",
-                                 "gcs remote message": "Idle",
-                                 "heartbeat monitor sleep": "Idle",
-                                 "GCR sleep": "Idle",
-                                 "SGA: MMAN sleep for component shrink": "Idle",
-                                 "retry contact SCN lock master": "Cluster",
-                                 "control file sequential read": "System I/O",
-                                 "control file single write": "System I/O",
-                                 "control file parallel write": "System I/O",
-                                 "control file backup creation": "Administrative",
-                                 "Shared IO Pool Memory": "Concurrency",
-                                 "Shared IO Pool IO Completion": "User I/O",
-                                 "remote log force - commit": "Commit",
-                                 "remote log force - buffer update": "Cluster",
-                                 "remote log force - buffer read": "Cluster",
-                                 "remote log force - buffer send": "Cluster",
-                                 "remote log force - SCN range": "Cluster",
-                                 "remote log force - session cleanout": "Cluster",
-                                 "enq: PW - flush prewarm buffers": "Application",
-                                 "latch: cache buffers chains": "Concurrency",
-                                 "free buffer waits": "Configuration",
-                                 "local write wait": "User I/O",
-                                 "checkpoint completed": "Configuration",
-                                 "write complete waits": "Configuration",
-                                 "write complete waits: flash cache": "Configuration",
-                                 "buffer read retry": "User I/O",
-                                 "buffer busy waits": "Concurrency",
-                                 "gc buffer busy acquire": "Cluster",
-                                 "gc buffer busy release": "Cluster",
-                                 "read by other session": "User I/O",
-                                 "multiple dbwriter suspend/resume for file offline": "Administrative",
-                                 "recovery read": "System I/O",
-                                 "pi renounce write complete": "Cluster",
-                                 "db flash cache single block physical read": "User I/O",
-                                 "db flash cache multiblock physical read": "User I/O",
-                                 "db flash cache write": "User I/O",
-                                 "db flash cache invalidate wait": "Concurrency",
-                                 "db flash cache dynamic disabling wait": "Administrative",
-                                 "enq: RO - contention": "Application",
-                                 "enq: RO - fast object reuse": "Application",
-                                 "enq: KO - fast object checkpoint": "Application",
-                                 "MRP redo arrival": "Idle",
-                                 "RFS sequential i/o": "System I/O",
-                                 "RFS random i/o": "System I/O",
-                                 "RFS write": "System I/O",
-                                 "ARCH wait for net re-connect": "Network",
-                                 "ARCH wait for netserver start": "Network",
-                                 "LNS wait on LGWR": "Network",
-                                 "LGWR wait on LNS": "Network",
-                                 "ARCH wait for netserver init 2": "Network",
-                                 "ARCH wait for flow-control": "Network",
-                                 "ARCH wait for netserver detach": "Network",
-                                 "LNS ASYNC archive log": "Idle",
-                                 "LNS ASYNC dest activation": "Idle",
-                                 "LNS ASYNC end of log": "Idle",
-                                 "log file sequential read": "System I/O",
-                                 "log file single write": "System I/O",
-                                 "log file parallel write": "System I/O",
-                                 "latch: redo writing": "Configuration",
-                                 "latch: redo copy": "Configuration",
-                                 "log buffer space": "Configuration",
-                                 "log file switch (checkpoint incomplete)": "Configuration",
-                                 "log file switch (private strand flush incomplete)": "Configuration",
-                                 "log file switch (archiving needed)": "Configuration",
-                                 "switch logfile command": "Administrative",
-                                 "log file switch completion": "Configuration",
-                                 "log file sync": "Commit",
-                                 "log file sync: SCN ordering": "Concurrency",
-                                 "simulated log write delay": "Idle",
-                                 "heartbeat redo informer": "Idle",
-                                 "LGWR real time apply sync": "Idle",
-                                 "LGWR worker group idle": "Idle",
-                                 "remote log force - log switch/recovery": "Cluster",
-                                 "db file sequential read": "User I/O",
-                                 "db file scattered read": "User I/O",
-                                 "db file single write": "User I/O",
-                                 "db file parallel write": "System I/O",
-                                 "db file async I/O submit": "System I/O",
-                                 "db file parallel read": "User I/O",
-                                 "enq: MV - datafile move": "Administrative",
-                                 "gc current request": "Cluster",
-                                 "gc cr request": "Cluster",
-                                 "gc cr disk request": "Cluster",
-                                 "gc cr multi block request": "Cluster",
-                                 "gc current multi block request": "Cluster",
-                                 "gc block recovery request": "Cluster",
-                                 "gc imc multi block request": "Cluster",
-                                 "gc imc multi block quiesce": "Cluster",
-                                 "gc cr block 2-way": "Cluster",
-                                 "gc cr block 3-way": "Cluster",
-                                 "gc cr block busy": "Cluster",
-                                 "gc cr block congested": "Cluster",
-                                 "gc cr failure": "Cluster",
-                                 "gc cr block lost": "Cluster",
-                                 "gc cr block unknown": "Cluster",
-                                 "gc current block 2-way": "Cluster",
-                                 "gc current block 3-way": "Cluster",
-                                 "gc current block busy": "Cluster",
-                                 "gc current block congested": "Cluster",
-                                 "gc current retry": "Cluster",
-                                 "gc current block lost": "Cluster",
-                                 "gc current split": "Cluster",
-                                 "gc current block unknown": "Cluster",
-                                 "gc cr grant 2-way": "Cluster",
-                                 "gc cr grant busy": "Cluster",
-                                 "gc cr grant congested": "Cluster",
-                                 "gc cr grant unknown": "Cluster",
-                                 "gc cr disk read": "Cluster",
-                                 "gc cr grant ka": "Cluster",
-                                 "gc cr grant cluster flash cache read": "Cluster",
-                                 "gc cr cluster flash cache read": "Cluster",
-                                 "gc cr flash cache copy": "Cluster",
-                                 "gc current grant 2-way": "Cluster",
-                                 "gc current grant busy": "Cluster",
-                                 "gc current grant congested": "Cluster",
-                                 "gc current grant unknown": "Cluster",
-                                 "gc current grant ka": "Cluster",
-                                 "gc current grant cluster flash cache read": "Cluster",
-                                 "gc freelist": "Cluster",
-                                 "gc remaster": "Cluster",
-                                 "gc quiesce": "Cluster",
-                                 "gc recovery": "Cluster",
-                                 "gc flushed buffer": "Cluster",
-                                 "gc send complete": "Cluster",
-                                 "gc current cancel": "Cluster",
-                                 "gc cr cancel": "Cluster",
-                                 "gc assume": "Cluster",
-                                 "gc domain validation": "Cluster",
-                                 "gc recovery free": "Cluster",
-                                 "gc recovery quiesce": "Cluster",
-                                 "gc claim": "Cluster",
-                                 "gc cancel retry": "Cluster",
-                                 "direct path read": "User I/O",
-                                 "direct path read temp": "User I/O",
-                                 "direct path write": "User I/O",
-                                 "direct path write temp": "User I/O",
-                                 "parallel recovery slave idle wait": "Idle",
-                                 "Backup Appliance waiting for work": "Idle",
-                                 "Backup Appliance waiting restore start": "Idle",
-                                 "Backup Appliance Surrogate wait": "Idle",
-                                 "Backup Appliance Servlet wait": "Idle",
-                                 "Backup Appliance Comm SGA setup wait": "Idle",
-                                 "LogMiner builder: idle": "Idle",
-                                 "LogMiner builder: memory": "Queueing",
-                                 "LogMiner builder: DDL": "Queueing",
-                                 "LogMiner builder: branch": "Idle",
-                                 "LogMiner preparer: idle": "Idle",
-                                 "LogMiner preparer: memory": "Queueing",
-                                 "LogMiner reader: buffer": "Queueing",
-                                 "LogMiner reader: log (idle)": "Idle",
-                                 "LogMiner reader: redo (idle)": "Idle",
-                                 "LogMiner client: transaction": "Idle",
-                                 "LogMiner: other": "Idle",
-                                 "LogMiner: activate": "Idle",
-                                 "LogMiner: reset": "Idle",
-                                 "LogMiner: find session": "Idle",
-                                 "LogMiner: internal": "Idle",
-                                 "Logical Standby Apply Delay": "Idle",
-                                 "wait for possible quiesce finish": "Administrative",
-                                 "parallel recovery coordinator waits for slave cleanup": "Idle",
-                                 "flashback log file write": "System I/O",
-                                 "flashback log file read": "System I/O",
-                                 "flashback buf free by RVWR": "Configuration",
-                                 "flashback log file sync": "User I/O",
-                                 "parallel recovery coordinator idle wait": "Idle",
-                                 "parallel recovery control message reply": "Idle",
-                                 "cell smart table scan": "User I/O",
-                                 "cell smart index scan": "User I/O",
-                                 "cell external table smart scan": "User I/O",
-                                 "cell statistics gather": "User I/O",
-                                 "cell smart incremental backup": "System I/O",
-                                 "cell smart file creation": "User I/O",
-                                 "cell smart restore from backup": "System I/O",
-                                 "parallel recovery slave next change": "Idle",
-                                 "concurrent I/O completion": "Administrative",
-                                 "datafile copy range completion": "Administrative",
-                                 "nologging standby txn commit": "Commit",
-                                 "nologging range consumption list": "Configuration",
-                                 "recovery sender idle wait": "Idle",
-                                 "recovery receiver idle wait": "Idle",
-                                 "recovery merger idle wait ": "Idle",
-                                 "enq: TM - contention": "Application",
-                                 "enq: ST - contention": "Configuration",
-                                 "undo segment extension": "Configuration",
-                                 "undo segment tx slot": "Configuration",
-                                 "switch undo - offline": "Administrative",
-                                 "alter rbs offline": "Administrative",
-                                 "enq: TX - row lock contention": "Application",
-                                 "enq: TX - allocate ITL entry": "Configuration",
-                                 "enq: TX - index contention": "Concurrency",
-                                 "enq: TW - contention": "Administrative",
-                                 "PX Deq: Txn Recovery Start": "Idle",
-                                 "PX Deq: Txn Recovery Reply": "Idle",
-                                 "latch: Undo Hint Latch": "Concurrency",
-                                 "statement suspended, wait error to be cleared": "Configuration",
-                                 "latch: In memory undo latch": "Concurrency",
-                                 "latch: MQL Tracking Latch": "Concurrency",
-                                 "fbar timer": "Idle",
-                                 "Archive Manager file transfer I/O": "User I/O",
-                                 "SecureFile log buffer": "Configuration",
-                                 "IM buffer busy": "Concurrency",
-                                 "securefile chain update": "Concurrency",
-                                 "enq: HW - contention": "Configuration",
-                                 "enq: SS - contention": "Configuration",
-                                 "sort segment request": "Configuration",
-                                 "smon timer": "Idle",
-                                 "PX Deq: Metadata Update": "Idle",
-                                 "Space Manager: slave idle wait": "Idle",
-                                 "enq: SQ - contention": "Configuration",
-                                 "PX Deq: Index Merge Reply": "Idle",
-                                 "PX Deq: Index Merge Execute": "Idle",
-                                 "PX Deq: Index Merge Close": "Idle",
-                                 "enq: HV - contention": "Concurrency",
-                                 "PX Deq: kdcph_mai": "Idle",
-                                 "PX Deq: kdcphc_ack": "Idle",
-                                 "index (re)build online start": "Administrative",
-                                 "index (re)build online cleanup": "Administrative",
-                                 "index (re)build online merge": "Administrative",
-                                 "securefile direct-read completion": "User I/O",
-                                 "securefile direct-write completion": "User I/O",
-                                 "SecureFile mutex": "Concurrency",
-                                 "enq: WG - lock fso": "Concurrency",
-                                 "imco timer": "Idle",
-                                 "Inmemory Populate: get loadscn": "Concurrency",
-                                 "latch: row cache objects": "Concurrency",
-                                 "row cache lock": "Concurrency",
-                                 "row cache read": "Concurrency",
-                                 "libcache interrupt action by LCK": "Concurrency",
-                                 "cursor: mutex X": "Concurrency",
-                                 "cursor: mutex S": "Concurrency",
-                                 "cursor: pin X": "Concurrency",
-                                 "cursor: pin S": "Concurrency",
-                                 "cursor: pin S wait on X": "Concurrency",
-                                 "enq: CB - role operation": "Concurrency",
-                                 "Global transaction acquire instance locks": "Configuration",
-                                 "enq: BB - 2PC across RAC instances": "Commit",
-                                 "latch: shared pool": "Concurrency",
-                                 "LCK0 row cache object free": "Concurrency",
-                                 "library cache pin": "Concurrency",
-                                 "library cache lock": "Concurrency",
-                                 "library cache load lock": "Concurrency",
-                                 "library cache: mutex X": "Concurrency",
-                                 "library cache: mutex S": "Concurrency",
-                                 "BFILE read": "User I/O",
-                                 "resmgr:cpu quantum": "Scheduler",
-                                 "resmgr:large I/O queued": "Scheduler",
-                                 "resmgr:small I/O queued": "Scheduler",
-                                 "resmgr:internal state change": "Concurrency",
-                                 "resmgr:sessions to exit": "Concurrency",
-                                 "resmgr:become active": "Scheduler",
-                                 "resmgr:pq queued": "Scheduler",
-                                 "TCP Socket (KGAS)": "Network",
-                                 "utl_file I/O": "User I/O",
-                                 "alter system set dispatcher": "Administrative",
-                                 "virtual circuit wait": "Network",
-                                 "virtual circuit next request": "Idle",
-                                 "shared server idle wait": "Idle",
-                                 "dispatcher timer": "Idle",
-                                 "dispatcher listen timer": "Network",
-                                 "dedicated server timer": "Network",
-                                 "cmon timer": "Idle",
-                                 "pool server timer": "Idle",
-                                 "connection pool wait": "Administrative",
-                                 "connection broker handoff": "Network",
-                                 "lreg timer": "Idle",
-                                 "JOX Jit Process Sleep": "Idle",
-                                 "jobq slave wait": "Idle",
-                                 "Wait for Table Lock": "Application",
-                                 "pipe get": "Idle",
-                                 "pipe put": "Concurrency",
-                                 "enq: DB - contention": "Administrative",
-                                 "PX Deque wait": "Idle",
-                                 "PX Idle Wait": "Idle",
-                                 "PX Deq: Join ACK": "Idle",
-                                 "PX Deq Credit: need buffer": "Idle",
-                                 "PX Deq Credit: send blkd": "Idle",
-                                 "PX Deq: Msg Fragment": "Idle",
-                                 "PX Deq: Parse Reply": "Idle",
-                                 "PX Deq: Execute Reply": "Idle",
-                                 "PX Deq: Execution Msg": "Idle",
-                                 "PX Deq: Table Q Normal": "Idle",
-                                 "PX Deq: Table Q Sample": "Idle",
-                                 "external table read": "User I/O",
-                                 "external table write": "User I/O",
-                                 "external table open": "User I/O",
-                                 "external table seek": "User I/O",
-                                 "external table misc IO": "User I/O",
-                                 "enq: RC - Result Cache: Contention": "Application",
-                                 "enq: JX - SQL statement queue": "Scheduler",
-                                 "enq: JX - cleanup of  queue": "Scheduler",
-                                 "PX Queuing: statement queue": "Scheduler",
-                                 "dbverify reads": "User I/O",
-                                 "REPL Apply: txns": "Idle",
-                                 "REPL Capture: subscribers to catch up": "Queueing",
-                                 "REPL Capture/Apply: memory": "Queueing",
-                                 "REPL Apply: commit": "Configuration",
-                                 "REPL Apply: dependency": "Concurrency",
-                                 "REPL Capture/Apply: flow control": "Queueing",
-                                 "REPL Capture/Apply: messages": "Idle",
-                                 "REPL Capture: archive log": "Idle",
-                                 "REPL Capture: filter callback ruleset": "Application",
-                                 "REPL Apply: apply DDL": "Application",
-                                 "enq: ZG - contention": "Administrative",
-                                 "single-task message": "Idle",
-                                 "SQL*Net message to client": "Network",
-                                 "SQL*Net message to dblink": "Network",
-                                 "SQL*Net more data to client": "Network",
-                                 "SQL*Net more data to dblink": "Network",
-                                 "SQL*Net message from client": "Idle",
-                                 "SQL*Net more data from client": "Network",
-                                 "SQL*Net message from dblink": "Network",
-                                 "SQL*Net more data from dblink": "Network",
-                                 "SQL*Net vector message from client": "Idle",
-                                 "SQL*Net vector message from dblink": "Idle",
-                                 "SQL*Net vector data to client": "Network",
-                                 "SQL*Net vector data from client": "Network",
-                                 "SQL*Net vector data to dblink": "Network",
-                                 "SQL*Net vector data from dblink": "Network",
-                                 "SQL*Net break/reset to client": "Application",
-                                 "SQL*Net break/reset to dblink": "Application",
-                                 "External Procedure initial connection": "Application",
-                                 "External Procedure call": "Application",
-                                 "PL/SQL lock timer": "Idle",
-                                 "enq: UL - contention": "Application",
-                                 "wait for EMON to process ntfns": "Configuration",
-                                 "Streams AQ: emn coordinator idle wait": "Idle",
-                                 "EMON slave idle wait": "Idle",
-                                 "Emon coordinator main loop": "Idle",
-                                 "Emon slave main loop": "Idle",
-                                 "Streams AQ: waiting for messages in the queue": "Idle",
-                                 "Streams AQ: waiting for time management or cleanup tasks": "Idle",
-                                 "Streams AQ: enqueue blocked on low memory": "Queueing",
-                                 "Streams AQ: enqueue blocked due to flow control": "Queueing",
-                                 "Streams AQ: delete acknowledged messages": "Idle",
-                                 "Streams AQ: deallocate messages from Streams Pool": "Idle",
-                                 "Streams AQ: qmn coordinator idle wait": "Idle",
-                                 "Streams AQ: qmn slave idle wait": "Idle",
-                                 "AQ: 12c message cache init wait": "Idle",
-                                 "AQ Cross Master idle": "Idle",
-                                 "AQPC idle": "Idle",
-                                 "Streams AQ: load balancer idle": "Idle",
-                                 "Sharded  Queues : Part Maintenance idle": "Idle",
-                                 "REPL Capture/Apply: RAC AQ qmn coordinator": "Idle",
-                                 "HS message to agent": "Idle",
-                                 "TEXT: URL_DATASTORE network wait": "Network",
-                                 "TEXT: File System I/O": "User I/O",
-                                 "OLAP DML Sleep": "Application",
-                                 "Cube Build Master Wait for Jobs": "Concurrency",
-                                 "ASM sync cache disk read": "User I/O",
-                                 "ASM sync relocation I/O": "System I/O",
-                                 "ASM async relocation I/O": "System I/O",
-                                 "ASM COD rollback operation completion": "Administrative",
-                                 "kfk: async disk IO": "System I/O",
-                                 "ASM remote SQL": "Network",
-                                 "ASM background timer": "Idle",
-                                 "iowp io": "System I/O",
-                                 "iowp msg": "Idle",
-                                 "iowp file id": "Idle",
-                                 "netp network": "Idle",
-                                 "gopp msg": "Idle",
-                                 "ASM Fixed Package I/O": "User I/O",
-                                 "ASM mount : wait for heartbeat": "Administrative",
-                                 "ASM PST query : wait for [PM][grp][0] grant": "Cluster",
-                                 "lock remastering": "Cluster",
-                                 "ASM Staleness File I/O": "User I/O",
-                                 "auto-sqltune: wait graph update": "Idle",
-                                 "WCR: replay client notify": "Idle",
-                                 "WCR: replay clock": "Idle",
-                                 "WCR: replay lock order": "Application",
-                                 "WCR: replay paused": "Idle",
-                                 "JS kgl get object wait": "Administrative",
-                                 "JS external job": "Idle",
-                                 "JS kill job wait": "Administrative",
-                                 "JS coord start wait": "Administrative",
-                                 "cell single block physical read": "User I/O",
-                                 "cell multiblock physical read": "User I/O",
-                                 "cell list of blocks physical read": "User I/O",
-                                 "cell physical read no I/O": "User I/O",
-                                 "cell single block read request": "User I/O",
-                                 "cell multiblock read request": "User I/O",
-                                 "cell list of blocks read request": "User I/O",
-                                 "cell manager opening cell": "System I/O",
-                                 "cell manager closing cell": "System I/O",
-                                 "cell manager discovering disks": "System I/O",
-                                 "cell worker idle": "Idle",
-                                 "events in waitclass Other": "Other",
-                                 "enq: WM - WLM Plan activation": "Other",
-                                 "latch free": "Other",
-                                 "kslwait unit test event 1": "Other",
-                                 "kslwait unit test event 2": "Other",
-                                 "kslwait unit test event 3": "Other",
-                                 "unspecified wait event": "Other",
-                                 "latch activity": "Other",
-                                 "wait list latch activity": "Other",
-                                 "wait list latch free": "Other",
-                                 "global enqueue expand wait": "Other",
-                                 "free process state object": "Other",
-                                 "inactive session": "Other",
-                                 "process terminate": "Other",
-                                 "latch: call allocation": "Other",
-                                 "latch: session allocation": "Other",
-                                 "check CPU wait times": "Other",
-                                 "enq: CI - contention": "Other",
-                                 "enq: PR - contention": "Other",
-                                 "enq: AK -  contention": "Other",
-                                 "enq: XK -  contention": "Other",
-                                 "enq: DI -  contention": "Other",
-                                 "enq: RM -  contention": "Other",
-                                 "enq: BO -  contention": "Other",
-                                 "ges resource enqueue open retry sleep": "Other",
-                                 "ksim generic wait event": "Other",
-                                 "debugger command": "Other",
-                                 "ksdxexeother": "Other",
-                                 "ksdxexeotherwait": "Other",
-                                 "latch: ksm sga alloc latch": "Other",
-                                 "defer SGA allocation slave": "Other",
-                                 "SGA Allocator termination": "Other",
-                                 "enq: PE - contention": "Other",
-                                 "enq: PG - contention": "Other",
-                                 "ksbsrv": "Other",
-                                 "ksbcic": "Other",
-                                 "process startup": "Other",
-                                 "process shutdown": "Other",
-                                 "prior spawner clean up": "Other",
-                                 "latch: messages": "Other",
-                                 "rdbms ipc message block": "Other",
-                                 "rdbms ipc reply": "Other",
-                                 "latch: enqueue hash chains": "Other",
-                                 "enq: FP - global fob contention": "Other",
-                                 "enq: RE - block repair contention": "Other",
-                                 "enq: BM - clonedb bitmap file write": "Other",
-                                 "asynch descriptor resize": "Other",
-                                 "enq: FO - file system operation contention": "Other",
-                                 "imm op": "Other",
-                                 "slave exit": "Other",
-                                 "enq: KM - contention": "Other",
-                                 "enq: KT - contention": "Other",
-                                 "enq: CA - contention": "Other",
-                                 "enq: KD - determine DBRM master": "Other",
-                                 "reliable message": "Other",
-                                 "broadcast mesg queue transition": "Other",
-                                 "broadcast mesg recovery queue transition": "Other",
-                                 "KSV master wait": "Other",
-                                 "master exit": "Other",
-                                 "ksv slave avail wait": "Other",
-                                 "enq: PV - syncstart": "Other",
-                                 "enq: PV - syncshut": "Other",
-                                 "enq: SP - contention 1": "Other",
-                                 "enq: SP - contention 2": "Other",
-                                 "enq: SP - contention 3": "Other",
-                                 "enq: SP - contention 4": "Other",
-                                 "enq: SX - contention 5": "Other",
-                                 "enq: SX - contention 6": "Other",
-                                 "first spare wait event": "Other",
-                                 "second spare wait event": "Other",
-                                 "IPC send completion sync": "Other",
-                                 "OSD IPC library": "Other",
-                                 "IPC wait for name service busy": "Other",
-                                 "IPC busy async request": "Other",
-                                 "IPC waiting for OSD resources": "Other",
-                                 "ksxr poll remote instances": "Other",
-                                 "ksxr wait for mount shared": "Other",
-                                 "DBMS_LDAP: LDAP operation ": "Other",
-                                 "wait for FMON to come up": "Other",
-                                 "enq: FM - contention": "Other",
-                                 "enq: XY - contention": "Other",
-                                 "set director factor wait": "Other",
-                                 "latch: active service list": "Other",
-                                 "enq: AS - service activation": "Other",
-                                 "enq: PD - contention": "Other",
-                                 "oracle thread bootstrap": "Other",
-                                 "os thread creation": "Other",
-                                 "cleanup of aborted process": "Other",
-                                 "enq: XM -  contention": "Other",
-                                 "enq: RU - contention": "Other",
-                                 "enq: RU - waiting": "Other",
-                                 "rolling migration: cluster quiesce": "Other",
-                                 "LMON global data update": "Other",
-                                 "process diagnostic dump": "Other",
-                                 "enq: MX - sync storage server info": "Other",
-                                 "master diskmon startup": "Other",
-                                 "master diskmon read": "Other",
-                                 "DSKM to complete cell health check": "Other",
-                                 "pmon dblkr tst event": "Other",
-                                 "pmon cleanup on exit": "Other",
-                                 "latch: ksolt alloc": "Other",
-                                 "lightweight thread operation": "Other",
-                                 "enq: ZX - repopulation file write": "Other",
-                                 "DIAG lock acquisition": "Other",
-                                 "latch: ges resource hash list": "Other",
-                                 "DFS lock handle": "Other",
-                                 "ges LMD to shutdown": "Other",
-                                 "ges client process to exit": "Other",
-                                 "ges global resource directory to be frozen": "Other",
-                                 "ges resource directory to be unfrozen": "Other",
-                                 "gcs resource directory to be unfrozen": "Other",
-                                 "ges LMD to inherit communication channels": "Other",
-                                 "ges lmd sync during reconfig": "Other",
-                                 "ges wait for lmon to be ready": "Other",
-                                 "ges cgs registration": "Other",
-                                 "wait for master scn": "Other",
-                                 "ges yield cpu in reconfig": "Other",
-                                 "ges2 proc latch in rm latch get 1": "Other",
-                                 "ges2 proc latch in rm latch get 2": "Other",
-                                 "ges lmd/lmses to freeze in rcfg": "Other",
-                                 "ges lmd/lmses to unfreeze in rcfg": "Other",
-                                 "ges lms sync during dynamic remastering and reconfig": "Other",
-                                 "ges LMON to join CGS group": "Other",
-                                 "ges pmon to exit": "Other",
-                                 "ges lmd and pmon to attach": "Other",
-                                 "gcs drm freeze begin": "Other",
-                                 "gcs retry nowait latch get": "Other",
-                                 "gcs remastering wait for read latch": "Other",
-                                 "ges cached resource cleanup": "Other",
-                                 "ges generic event": "Other",
-                                 "ges retry query node": "Other",
-                                 "ges process with outstanding i/o": "Other",
-                                 "ges user error": "Other",
-                                 "ges enter server mode": "Other",
-                                 "gcs enter server mode": "Other",
-                                 "gcs drm freeze in enter server mode": "Other",
-                                 "gcs ddet enter server mode": "Other",
-                                 "ges cancel": "Other",
-                                 "ges resource cleanout during enqueue open": "Other",
-                                 "ges resource cleanout during enqueue open-cvt": "Other",
-                                 "ges master to get established for SCN op": "Other",
-                                 "ges LMON to get to FTDONE ": "Other",
-                                 "ges1 LMON to wake up LMD - mrcvr": "Other",
-                                 "ges2 LMON to wake up LMD - mrcvr": "Other",
-                                 "ges2 LMON to wake up lms - mrcvr 2": "Other",
-                                 "ges2 LMON to wake up lms - mrcvr 3": "Other",
-                                 "ges inquiry response": "Other",
-                                 "ges reusing os pid": "Other",
-                                 "ges LMON for send queues": "Other",
-                                 "ges LMD suspend for testing event": "Other",
-                                 "ges performance test completion": "Other",
-                                 "kjbopen wait for recovery domain attach": "Other",
-                                 "kjudomatt wait for recovery domain attach": "Other",
-                                 "kjudomdet wait for recovery domain detach": "Other",
-                                 "kjbdomalc allocate recovery domain - retry": "Other",
-                                 "kjbdrmcvtq lmon drm quiesce: ping completion": "Other",
-                                 "ges RMS0 retry add redo log": "Other",
-                                 "readable standby redo apply remastering": "Other",
-                                 "ges DFS hang analysis phase 2 acks": "Other",
-                                 "ges/gcs diag dump": "Other",
-                                 "global plug and play automatic resource creation": "Other",
-                                 "gcs lmon dirtydetach step completion": "Other",
-                                 "recovery instance recovery completion": "Other",
-                                 "ack for a broadcasted res from a remote instance": "Other",
-                                 "latch: kjci process context latch": "Other",
-                                 "latch: kjci request sequence latch": "Other",
-                                 "DLM cross inst call completion": "Other",
-                                 "DLM: shared instance mode init": "Other",
-                                 "enq: KI - contention": "Other",
-                                 "latch: kjoeq omni enqueue hash bucket latch": "Other",
-                                 "DLM enqueue copy completion": "Other",
-                                 "latch: kjoer owner hash bucket": "Other",
-                                 "DLM Omni Enq Owner replication": "Other",
-                                 "KJC: Wait for msg sends to complete": "Other",
-                                 "ges message buffer allocation": "Other",
-                                 "kjctssqmg: quick message send wait": "Other",
-                                 "kjctcisnd: Queue/Send client message": "Other",
-                                 "gcs domain validation": "Other",
-                                 "latch: gcs resource hash": "Other",
-                                 "affinity expansion in replay": "Other",
-                                 "wait for sync ack": "Other",
-                                 "wait for verification ack": "Other",
-                                 "wait for assert messages to be sent": "Other",
-                                 "wait for scn ack": "Other",
-                                 "lms flush message acks": "Other",
-                                 "name-service call wait": "Other",
-                                 "CGS wait for IPC msg": "Other",
-                                 "kjxgrtest": "Other",
-                                 "IMR mount phase II completion": "Other",
-                                 "IMR disk votes": "Other",
-                                 "IMR rr lock release": "Other",
-                                 "IMR net-check message ack": "Other",
-                                 "IMR rr update": "Other",
-                                 "IMR membership resolution": "Other",
-                                 "IMR CSS join retry": "Other",
-                                 "CGS skgxn join retry": "Other",
-                                 "gcs to be enabled": "Other",
-                                 "gcs log flush sync": "Other",
-                                 "enq: PP -  contention": "Other",
-                                 "enq: HM -  contention": "Other",
-                                 "GCR ctx lock acquisition": "Other",
-                                 "GCR CSS group lock": "Other",
-                                 "GCR CSS group join": "Other",
-                                 "GCR CSS group leave": "Other",
-                                 "GCR CSS group update": "Other",
-                                 "GCR CSS group query": "Other",
-                                 "enq: AC - acquiring partition id": "Other",
-                                 "SGA: allocation forcing component growth": "Other",
-                                 "SGA: sga_target resize": "Other",
-                                 "enq: SC -  contention": "Other",
-                                 "control file heartbeat": "Other",
-                                 "control file diagnostic dump": "Other",
-                                 "enq: CF - contention": "Other",
-                                 "enq: SW - contention": "Other",
-                                 "enq: DS - contention": "Other",
-                                 "enq: TC - contention": "Other",
-                                 "enq: TC - contention2": "Other",
-                                 "buffer exterminate": "Other",
-                                 "buffer resize": "Other",
-                                 "latch: cache buffers lru chain": "Other",
-                                 "enq: PW - perwarm status in dbw0": "Other",
-                                 "latch: checkpoint queue latch": "Other",
-                                 "latch: cache buffer handles": "Other",
-                                 "kcbzps": "Other",
-                                 "DBWR range invalidation sync": "Other",
-                                 "buffer deadlock": "Other",
-                                 "buffer latch": "Other",
-                                 "cr request retry": "Other",
-                                 "writes stopped by instance recovery or database suspension": "Other",
-                                 "lock escalate retry": "Other",
-                                 "lock deadlock retry": "Other",
-                                 "prefetch warmup block being transferred": "Other",
-                                 "recovery buffer pinned": "Other",
-                                 "TSE master key rekey": "Other",
-                                 "TSE SSO wallet reopen": "Other",
-                                 "force-cr-override flush": "Other",
-                                 "enq: CR - block range reuse ckpt": "Other",
-                                 "wait for MTTR advisory state object": "Other",
-                                 "latch: object queue header operation": "Other",
-                                 "retry cftxn during close": "Other",
-                                 "get branch/thread/sequence enqueue": "Other",
-                                 "enq: WL - Test access/locking": "Other",
-                                 "Data Guard server operation completion": "Other",
-                                 "FAL archive wait 1 sec for REOPEN minimum": "Other",
-                                 "TEST: action sync": "Other",
-                                 "TEST: action hang": "Other",
-                                 "RSGA: RAC reconfiguration": "Other",
-                                 "enq: WL - RAC-wide SGA initialize": "Other",
-                                 "enq: WL - RAC-wide SGA write": "Other",
-                                 "enq: WL - RAC-wide SGA dump": "Other",
-                                 "LGWR ORL/NoExp FAL archival": "Other",
-                                 "enq: WS -  contention": "Other",
-                                 "MRP wait on process start": "Other",
-                                 "MRP wait on process restart": "Other",
-                                 "MRP wait on startup clear": "Other",
-                                 "MRP inactivation": "Other",
-                                 "MRP termination": "Other",
-                                 "MRP state inspection": "Other",
-                                 "MRP wait on archivelog arrival": "Other",
-                                 "MRP wait on archivelog archival": "Other",
-                                 "enq: WL - Far Sync Fail Over": "Other",
-                                 "Monitor testing": "Other",
-                                 "enq: WL - redo_db table update": "Other",
-                                 "enq: WL - redo_db table query": "Other",
-                                 "enq: WL - redo_log table update": "Other",
-                                 "enq: WL - redo_log table query": "Other",
-                                 "enq: PY - AVM RTA access instance": "Other",
-                                 "enq: PY - AVM RTA access database": "Other",
-                                 "enq: PY - AVM RTA access database 2": "Other",
-                                 "log switch/archive": "Other",
-                                 "enq: WL - Switchover To Primary": "Other",
-                                 "ARCH wait on c/f tx acquire 1": "Other",
-                                 "RFS attach": "Other",
-                                 "RFS create": "Other",
-                                 "RFS close": "Other",
-                                 "RFS announce": "Other",
-                                 "RFS register": "Other",
-                                 "RFS detach": "Other",
-                                 "RFS ping": "Other",
-                                 "RFS dispatch": "Other",
-                                 "enq: WL - RFS global state contention": "Other",
-                                 "LGWR simulation latency wait": "Other",
-                                 "LNS simulation latency wait": "Other",
-                                 "ASYNC Remote Write": "Other",
-                                 "SYNC Remote Write": "Other",
-                                 "ARCH Remote Write": "Other",
-                                 "Redo Transport Attach": "Other",
-                                 "Redo Transport Detach": "Other",
-                                 "Redo Transport Open": "Other",
-                                 "Redo Transport Close": "Other",
-                                 "Redo Transport Ping": "Other",
-                                 "Remote SYNC Ping": "Other",
-                                 "Redo Transport Slave Startup": "Other",
-                                 "Redo Transport Slave Shutdown": "Other",
-                                 "Redo Writer Remote Sync Notify": "Other",
-                                 "Redo Writer Remote Sync Complete": "Other",
-                                 "Redo Transport MISC": "Other",
-                                 "Data Guard: RFS disk I/O": "Other",
-                                 "ARCH wait for process start 1": "Other",
-                                 "ARCH wait for process death 1": "Other",
-                                 "ARCH wait for process start 3": "Other",
-                                 "Data Guard: process exit": "Other",
-                                 "Data Guard: process clean up": "Other",
-                                 "LGWR-LNS wait on channel": "Other",
-                                 "enq: WR - contention": "Other",
-                                 "Redo transport testing": "Other",
-                                 "enq: RZ - add element": "Other",
-                                 "enq: RZ - remove element": "Other",
-                                 "Image redo gen delay": "Other",
-                                 "LGWR wait for redo copy": "Other",
-                                 "latch: redo allocation": "Other",
-                                 "log file switch (clearing log file)": "Other",
-                                 "target log write size": "Other",
-                                 "LGWR any worker group": "Other",
-                                 "LGWR all worker groups": "Other",
-                                 "LGWR worker group ordering": "Other",
-                                 "LGWR intra group sync": "Other",
-                                 "LGWR intra group IO completion": "Other",
-                                 "enq: WL - contention": "Other",
-                                 "enq: RN - contention": "Other",
-                                 "DFS db file lock": "Other",
-                                 "enq: DF - contention": "Other",
-                                 "enq: IS - contention": "Other",
-                                 "enq: IP - open/close PDB": "Other",
-                                 "enq: FS - contention": "Other",
-                                 "enq: FS - online log operation": "Other",
-                                 "enq: DM - contention": "Other",
-                                 "enq: RP - contention": "Other",
-                                 "latch: gc element": "Other",
-                                 "enq: RT - contention": "Other",
-                                 "enq: RT - thread internal enable/disable": "Other",
-                                 "enq: IR - contention": "Other",
-                                 "enq: IR - contention2": "Other",
-                                 "enq: IR - global serialization": "Other",
-                                 "enq: IR - local serialization": "Other",
-                                 "enq: IR - arbitrate instance recovery": "Other",
-                                 "enq: MR - contention": "Other",
-                                 "enq: MR - standby role transition": "Other",
-                                 "enq: MR - multi instance redo apply": "Other",
-                                 "enq: MR - any role transition": "Other",
-                                 "enq: MR - PDB open": "Other",
-                                 "enq: MR - datafile online": "Other",
-                                 "enq: MR - adg instance recovery": "Other",
-                                 "shutdown after switchover to standby": "Other",
-                                 "cancel media recovery on switchover": "Other",
-                                 "parallel recovery coord wait for reply": "Other",
-                                 "parallel recovery coord send blocked": "Other",
-                                 "parallel recovery slave wait for change": "Other",
-                                 "enq: BR - file shrink": "Other",
-                                 "enq: BR - proxy-copy": "Other",
-                                 "enq: BR - multi-section restore header": "Other",
-                                 "enq: BR - multi-section restore section": "Other",
-                                 "enq: BR - space info datafile hdr update": "Other",
-                                 "enq: BR - request autobackup": "Other",
-                                 "enq: BR - perform autobackup": "Other",
-                                 "enq: BR - BA lock db": "Other",
-                                 "enq: BR - BA lock storage loc": "Other",
-                                 "enq: BR - BA lock timer queue": "Other",
-                                 "enq: BR - BA lock scheduler": "Other",
-                                 "enq: BR - BA lock API": "Other",
-                                 "enq: BR - BA quiesce storage ": "Other",
-                                 "enq: BR - BA check quiescence": "Other",
-                                 "enq: BR - BA run scheduler": "Other",
-                                 "enq: BR - BA purge storage loc": "Other",
-                                 "enq: BR - BA invalidate plans": "Other",
-                                 "enq: BR - BA protect plans": "Other",
-                                 "enq: ID - contention": "Other",
-                                 "Backup Restore Throttle sleep": "Other",
-                                 "Backup Restore Switch Bitmap sleep": "Other",
-                                 "Backup Restore Event 19778 sleep": "Other",
-                                 "enq: BS - Backup spare1": "Other",
-                                 "enq: BS - Backup spare2": "Other",
-                                 "enq: BS - Backup spare3": "Other",
-                                 "enq: BS - Backup spare4": "Other",
-                                 "enq: BS - Backup spare5": "Other",
-                                 "enq: BS - Backup spare6": "Other",
-                                 "enq: BS - Backup spare7": "Other",
-                                 "enq: BS - Backup spare8": "Other",
-                                 "enq: BS - Backup spare9": "Other",
-                                 "enq: BS - Backup spare0": "Other",
-                                 "enq: AB - ABMR process start/stop": "Other",
-                                 "enq: AB - ABMR process initialized": "Other",
-                                 "Auto BMR completion": "Other",
-                                 "Auto BMR RPC standby catchup": "Other",
-                                 "enq: BC - drop container group": "Other",
-                                 "enq: BC - create container": "Other",
-                                 "enq: BC - group - create container": "Other",
-                                 "enq: BC - drop container": "Other",
-                                 "enq: BC - group - create file": "Other",
-                                 "enq: BI - create file": "Other",
-                                 "enq: BI - identify file": "Other",
-                                 "enq: BI - delete file": "Other",
-                                 "enq: BZ - resize file": "Other",
-                                 "enq: BV - rebuild/validate group": "Other",
-                                 "Backup Appliance container synchronous read": "Other",
-                                 "Backup Appliance container synchronous write": "Other",
-                                 "Backup Appliance container I/O": "Other",
-                                 "enq: MN - contention": "Other",
-                                 "enq: PL - contention": "Other",
-                                 "enq: CP - Pluggable database resetlogs": "Other",
-                                 "enq: SB - logical standby metadata": "Other",
-                                 "enq: SB - table instantiation": "Other",
-                                 "Logical Standby Apply shutdown": "Other",
-                                 "Logical Standby pin transaction": "Other",
-                                 "Logical Standby dictionary build": "Other",
-                                 "Logical Standby Terminal Apply": "Other",
-                                 "Logical Standby Debug": "Other",
-                                 "Resolution of in-doubt txns": "Other",
-                                 "enq: XR - quiesce database": "Other",
-                                 "enq: XR - database force logging": "Other",
-                                 "standby query scn advance": "Other",
-                                 "change tracking file synchronous read": "Other",
-                                 "change tracking file synchronous write": "Other",
-                                 "change tracking file parallel write": "Other",
-                                 "block change tracking buffer space": "Other",
-                                 "CTWR media recovery checkpoint request": "Other",
-                                 "enq: CT - global space management": "Other",
-                                 "enq: CT - local space management": "Other",
-                                 "enq: CT - change stream ownership": "Other",
-                                 "enq: CT - state": "Other",
-                                 "enq: CT - state change gate 1": "Other",
-                                 "enq: CT - state change gate 2": "Other",
-                                 "enq: CT - CTWR process start/stop": "Other",
-                                 "enq: CT - reading": "Other",
-                                 "recovery area: computing dropped files": "Other",
-                                 "recovery area: computing obsolete files": "Other",
-                                 "recovery area: computing backed up files": "Other",
-                                 "recovery area: computing applied logs": "Other",
-                                 "enq: RS - file delete": "Other",
-                                 "enq: RS - record reuse": "Other",
-                                 "enq: RS - prevent file delete": "Other",
-                                 "enq: RS - prevent aging list update": "Other",
-                                 "enq: RS - persist alert level": "Other",
-                                 "enq: RS - read alert level": "Other",
-                                 "enq: RS - write alert level": "Other",
-                                 "enq: FL - Flashback database log": "Other",
-                                 "enq: FL - Flashback db command": "Other",
-                                 "enq: FD - Marker generation": "Other",
-                                 "enq: FD - Tablespace flashback on/off": "Other",
-                                 "enq: FD - Flashback coordinator": "Other",
-                                 "enq: FD - Flashback on/off": "Other",
-                                 "enq: FD - Restore point create/drop": "Other",
-                                 "enq: FD - Flashback logical operations": "Other",
-                                 "flashback free VI log": "Other",
-                                 "flashback log switch": "Other",
-                                 "enq: FW -  contention": "Other",
-                                 "RVWR wait for flashback copy": "Other",
-                                 "parallel recovery read buffer free": "Other",
-                                 "parallel recovery redo cache buffer free": "Other",
-                                 "parallel recovery change buffer free": "Other",
-                                 "cell smart flash unkeep": "Other",
-                                 "parallel recovery coord: all replies": "Other",
-                                 "datafile move cleanup during resize": "Other",
-                                 "recovery receive buffer free": "Other",
-                                 "recovery send buffer free": "Other",
-                                 "DBMS_ROLLING instruction completion": "Other",
-                                 "blocking txn id for DDL": "Other",
-                                 "transaction": "Other",
-                                 "inactive transaction branch": "Other",
-                                 "txn to complete": "Other",
-                                 "PMON to cleanup pseudo-branches at svc stop time": "Other",
-                                 "PMON to cleanup detached branches at shutdown": "Other",
-                                 "test long ops": "Other",
-                                 "latch: undo global data": "Other",
-                                 "undo segment recovery": "Other",
-                                 "unbound tx": "Other",
-                                 "wait for change": "Other",
-                                 "wait for another txn - undo rcv abort": "Other",
-                                 "wait for another txn - txn abort": "Other",
-                                 "wait for another txn - rollback to savepoint": "Other",
-                                 "undo_retention publish retry": "Other",
-                                 "enq: TA - contention": "Other",
-                                 "enq: TX - contention": "Other",
-                                 "enq: US - contention": "Other",
-                                 "wait for stopper event to be increased": "Other",
-                                 "wait for a undo record": "Other",
-                                 "wait for a paralle reco to abort": "Other",
-                                 "enq: IM - contention for blr": "Other",
-                                 "enq: TD - KTF dump entries": "Other",
-                                 "enq: TE - KTF broadcast": "Other",
-                                 "enq: CN - race with txn": "Other",
-                                 "enq: CN - race with reg": "Other",
-                                 "enq: CN - race with init": "Other",
-                                 "latch: Change Notification Hash table latch": "Other",
-                                 "enq: CO - master slave det": "Other",
-                                 "enq: FE - contention": "Other",
-                                 "latch: change notification client cache latch": "Other",
-                                 "latch: SGA Logging Log Latch": "Other",
-                                 "latch: SGA Logging Bkt Latch": "Other",
-                                 "enq: MC - Securefile log": "Other",
-                                 "enq: MF - flush bkgnd periodic": "Other",
-                                 "enq: MF - creating swap in instance": "Other",
-                                 "enq: MF - flush space": "Other",
-                                 "enq: MF - flush client": "Other",
-                                 "enq: MF - flush prior error": "Other",
-                                 "enq: MF - flush destroy": "Other",
-                                 "latch: ILM activity tracking latch": "Other",
-                                 "latch: ILM access tracking extent": "Other",
-                                 "IM CU busy": "Other",
-                                 "enq: TF - contention": "Other",
-                                 "latch: lob segment hash table latch": "Other",
-                                 "latch: lob segment query latch": "Other",
-                                 "latch: lob segment dispenser latch": "Other",
-                                 "Wait for shrink lock2": "Other",
-                                 "Wait for shrink lock": "Other",
-                                 "L1 validation": "Other",
-                                 "Wait for TT enqueue": "Other",
-                                 "kttm2d": "Other",
-                                 "ktsambl": "Other",
-                                 "ktfbtgex": "Other",
-                                 "enq: DT - contention": "Other",
-                                 "enq: TS - contention": "Other",
-                                 "enq: FB - contention": "Other",
-                                 "enq: SK - contention": "Other",
-                                 "enq: DW - contention": "Other",
-                                 "enq: SU - contention": "Other",
-                                 "enq: TT - contention": "Other",
-                                 "ktm: instance recovery": "Other",
-                                 "instance state change": "Other",
-                                 "enq: SM -  contention": "Other",
-                                 "enq: SJ - Slave Task Cancel": "Other",
-                                 "Space Manager: slave messages": "Other",
-                                 "enq: FH - contention": "Other",
-                                 "latch: IM area scb latch": "Other",
-                                 "latch: IM area sb latch": "Other",
-                                 "enq: TZ - contention": "Other",
-                                 "enq: IN - contention": "Other",
-                                 "enq: ZB - contention": "Other",
-                                 "latch: IM seg hdr latch": "Other",
-                                 "latch: IM emb latch": "Other",
-                                 "enq: SV -  contention": "Other",
-                                 "index block split": "Other",
-                                 "kdblil wait before retrying ORA-54": "Other",
-                                 "dupl. cluster key": "Other",
-                                 "kdic_do_merge": "Other",
-                                 "enq: DL - contention": "Other",
-                                 "enq: HQ - contention": "Other",
-                                 "enq: HP - contention": "Other",
-                                 "enq: KL -  contention": "Other",
-                                 "enq: WG - delete fso": "Other",
-                                 "enq: SL - get lock": "Other",
-                                 "enq: SL - escalate lock": "Other",
-                                 "enq: SL - get lock for undo": "Other",
-                                 "enq: ZH - compression analysis": "Other",
-                                 "Compression analysis": "Other",
-                                 "enq: SZ - contention": "Other",
-                                 "enq: ZC - FS Seg contention": "Other",
-                                 "enq: ZD - FS CU mod": "Other",
-                                 "enq: SY - IM populate by other session": "Other",
-                                 "IM populate completion": "Other",
-                                 "In-Memory populate: over pga limit": "Other",
-                                 "row cache cleanup": "Other",
-                                 "row cache process": "Other",
-                                 "enq: QA -  contention": "Other",
-                                 "enq: QB -  contention": "Other",
-                                 "enq: QC -  contention": "Other",
-                                 "enq: QD -  contention": "Other",
-                                 "enq: QE -  contention": "Other",
-                                 "enq: QF -  contention": "Other",
-                                 "enq: QG -  contention": "Other",
-                                 "enq: QH -  contention": "Other",
-                                 "enq: QI -  contention": "Other",
-                                 "enq: QJ -  contention": "Other",
-                                 "enq: QK -  contention": "Other",
-                                 "enq: QL -  contention": "Other",
-                                 "enq: QM -  contention": "Other",
-                                 "enq: QN -  contention": "Other",
-                                 "enq: QO -  contention": "Other",
-                                 "enq: QP -  contention": "Other",
-                                 "enq: QQ -  contention": "Other",
-                                 "enq: QR -  contention": "Other",
-                                 "enq: QS -  contention": "Other",
-                                 "enq: QT -  contention": "Other",
-                                 "enq: QU -  contention": "Other",
-                                 "enq: QV -  contention": "Other",
-                                 "enq: QX -  contention": "Other",
-                                 "enq: QY -  contention": "Other",
-                                 "enq: QZ -  contention": "Other",
-                                 "enq: DV - contention": "Other",
-                                 "enq: SO - contention": "Other",
-                                 "enq: VA -  contention": "Other",
-                                 "enq: VB -  contention": "Other",
-                                 "enq: VC -  contention": "Other",
-                                 "enq: VD -  contention": "Other",
-                                 "enq: VE -  contention": "Other",
-                                 "enq: VF -  contention": "Other",
-                                 "enq: VG -  contention": "Other",
-                                 "enq: VH -  contention": "Other",
-                                 "enq: VI -  contention": "Other",
-                                 "enq: VJ -  contention": "Other",
-                                 "enq: VK -  contention": "Other",
-                                 "enq: VL -  contention": "Other",
-                                 "enq: VM -  contention": "Other",
-                                 "enq: VN -  contention": "Other",
-                                 "enq: VO -  contention": "Other",
-                                 "enq: VP -  contention": "Other",
-                                 "enq: VQ -  contention": "Other",
-                                 "enq: VR -  contention": "Other",
-                                 "enq: VS -  contention": "Other",
-                                 "enq: VT -  contention": "Other",
-                                 "enq: VU -  contention": "Other",
-                                 "enq: VV -  contention": "Other",
-                                 "enq: VX -  contention": "Other",
-                                 "enq: VY -  contention": "Other",
-                                 "enq: VZ -  contention": "Other",
-                                 "enq: EA -  contention": "Other",
-                                 "enq: EB -  contention": "Other",
-                                 "enq: EC -  contention": "Other",
-                                 "enq: ED -  contention": "Other",
-                                 "enq: EE -  contention": "Other",
-                                 "enq: EF -  contention": "Other",
-                                 "enq: EG -  contention": "Other",
-                                 "enq: EH -  contention": "Other",
-                                 "enq: EI -  contention": "Other",
-                                 "enq: EJ -  contention": "Other",
-                                 "enq: EK -  contention": "Other",
-                                 "enq: EL -  contention": "Other",
-                                 "enq: EM -  contention": "Other",
-                                 "enq: EN -  contention": "Other",
-                                 "enq: EO -  contention": "Other",
-                                 "enq: EP -  contention": "Other",
-                                 "enq: EQ -  contention": "Other",
-                                 "enq: ER -  contention": "Other",
-                                 "enq: ES -  contention": "Other",
-                                 "enq: ET -  contention": "Other",
-                                 "enq: EU -  contention": "Other",
-                                 "enq: EV -  contention": "Other",
-                                 "enq: EX -  contention": "Other",
-                                 "enq: EY -  contention": "Other",
-                                 "enq: EZ -  contention": "Other",
-                                 "enq: LA -  contention": "Other",
-                                 "enq: LB -  contention": "Other",
-                                 "enq: LC -  contention": "Other",
-                                 "enq: LD -  contention": "Other",
-                                 "enq: LE -  contention": "Other",
-                                 "enq: LF -  contention": "Other",
-                                 "enq: LG -  contention": "Other",
-                                 "enq: LH -  contention": "Other",
-                                 "enq: LI -  contention": "Other",
-                                 "enq: LJ -  contention": "Other",
-                                 "enq: LK -  contention": "Other",
-                                 "enq: LL -  contention": "Other",
-                                 "enq: LM -  contention": "Other",
-                                 "enq: LN -  contention": "Other",
-                                 "enq: LO -  contention": "Other",
-                                 "enq: LP -  contention": "Other",
-                                 "enq: LQ -  contention": "Other",
-                                 "enq: LR -  contention": "Other",
-                                 "enq: LS -  contention": "Other",
-                                 "enq: LT -  contention": "Other",
-                                 "enq: LU -  contention": "Other",
-                                 "enq: LV -  contention": "Other",
-                                 "enq: LX -  contention": "Other",
-                                 "enq: LY -  contention": "Other",
-                                 "enq: LZ -  contention": "Other",
-                                 "enq: YA -  contention": "Other",
-                                 "enq: YB -  contention": "Other",
-                                 "enq: YC -  contention": "Other",
-                                 "enq: YD -  contention": "Other",
-                                 "enq: YE -  contention": "Other",
-                                 "enq: YF -  contention": "Other",
-                                 "enq: YG -  contention": "Other",
-                                 "enq: YH -  contention": "Other",
-                                 "enq: YI -  contention": "Other",
-                                 "enq: YJ -  contention": "Other",
-                                 "enq: YK -  contention": "Other",
-                                 "enq: YL -  contention": "Other",
-                                 "enq: YM -  contention": "Other",
-                                 "enq: YN -  contention": "Other",
-                                 "enq: YO -  contention": "Other",
-                                 "enq: YP -  contention": "Other",
-                                 "enq: YQ -  contention": "Other",
-                                 "enq: YR -  contention": "Other",
-                                 "enq: YS -  contention": "Other",
-                                 "enq: YT -  contention": "Other",
-                                 "enq: YU -  contention": "Other",
-                                 "enq: YV -  contention": "Other",
-                                 "enq: YX -  contention": "Other",
-                                 "enq: YY -  contention": "Other",
-                                 "enq: YZ -  contention": "Other",
-                                 "enq: GA -  contention": "Other",
-                                 "enq: GB -  contention": "Other",
-                                 "enq: GC -  contention": "Other",
-                                 "enq: GD -  contention": "Other",
-                                 "enq: GE -  contention": "Other",
-                                 "enq: GF -  contention": "Other",
-                                 "enq: GG -  contention": "Other",
-                                 "enq: GH -  contention": "Other",
-                                 "enq: GI -  contention": "Other",
-                                 "enq: GJ -  contention": "Other",
-                                 "enq: GK -  contention": "Other",
-                                 "enq: GL -  contention": "Other",
-                                 "enq: GM -  contention": "Other",
-                                 "enq: GN -  contention": "Other",
-                                 "enq: GO -  contention": "Other",
-                                 "enq: GP -  contention": "Other",
-                                 "enq: GQ -  contention": "Other",
-                                 "enq: GR -  contention": "Other",
-                                 "enq: GS -  contention": "Other",
-                                 "enq: GT -  contention": "Other",
-                                 "enq: GU -  contention": "Other",
-                                 "enq: GV -  contention": "Other",
-                                 "enq: GX -  contention": "Other",
-                                 "enq: GY -  contention": "Other",
-                                 "enq: GZ -  contention": "Other",
-                                 "enq: NA -  contention": "Other",
-                                 "enq: NB -  contention": "Other",
-                                 "enq: NC -  contention": "Other",
-                                 "enq: ND -  contention": "Other",
-                                 "enq: NE -  contention": "Other",
-                                 "enq: NF -  contention": "Other",
-                                 "enq: NG -  contention": "Other",
-                                 "enq: NH -  contention": "Other",
-                                 "enq: NI -  contention": "Other",
-                                 "enq: NJ -  contention": "Other",
-                                 "enq: NK -  contention": "Other",
-                                 "enq: NL -  contention": "Other",
-                                 "enq: NM -  contention": "Other",
-                                 "enq: NN -  contention": "Other",
-                                 "enq: NO -  contention": "Other",
-                                 "enq: NP -  contention": "Other",
-                                 "enq: NQ -  contention": "Other",
-                                 "enq: NR -  contention": "Other",
-                                 "enq: NS -  contention": "Other",
-                                 "enq: NT -  contention": "Other",
-                                 "enq: NU -  contention": "Other",
-                                 "enq: NV -  contention": "Other",
-                                 "enq: NX -  contention": "Other",
-                                 "enq: NY -  contention": "Other",
-                                 "enq: NZ -  contention": "Other",
-                                 "enq: IV -  contention": "Other",
-                                 "enq: TP - contention": "Other",
-                                 "enq: RW - MV metadata contention": "Other",
-                                 "enq: OC - contention": "Other",
-                                 "enq: OL - contention": "Other",
-                                 "kkdlgon": "Other",
-                                 "kkdlsipon": "Other",
-                                 "kkdlhpon": "Other",
-                                 "kgltwait": "Other",
-                                 "kksfbc research": "Other",
-                                 "kksscl hash split": "Other",
-                                 "kksfbc child completion": "Other",
-                                 "enq: CU - contention": "Other",
-                                 "enq: AE - lock": "Other",
-                                 "enq: PF - contention": "Other",
-                                 "enq: IL - contention": "Other",
-                                 "enq: CL - drop label": "Other",
-                                 "enq: CL - compare labels": "Other",
-                                 "enq: SG - OLS Add Group": "Other",
-                                 "enq: SG - OLS Create Group": "Other",
-                                 "enq: SG - OLS Drop Group": "Other",
-                                 "enq: SG - OLS Alter Group Parent": "Other",
-                                 "enq: OP - OLS Store user entries": "Other",
-                                 "enq: OP - OLS Cleanup unused profiles": "Other",
-                                 "enq: CC - decryption": "Other",
-                                 "enq: MK - contention": "Other",
-                                 "enq: OW - initialization": "Other",
-                                 "enq: OW - termination": "Other",
-                                 "enq: RK - set key": "Other",
-                                 "enq: HC - HSM cache write": "Other",
-                                 "enq: HC - HSM cache read": "Other",
-                                 "enq: RL - RAC wallet lock": "Other",
-                                 "enq: ZZ - update hash tables": "Other",
-                                 "Failed Logon Delay": "Other",
-                                 "enq: ZA - add std audit table partition": "Other",
-                                 "enq: ZF - add fga audit table partition": "Other",
-                                 "enq: ZS - excl access to spill audit file": "Other",
-                                 "enq: PA - modify a privilege capture": "Other",
-                                 "enq: PA - read a privilege capture": "Other",
-                                 "enq: PC - update privilege capture info": "Other",
-                                 "enq: PC - read privilege capture info": "Other",
-                                 "enq: KZ -  contention": "Other",
-                                 "enq: DX - contention": "Other",
-                                 "enq: DR - contention": "Other",
-                                 "pending global transaction(s)": "Other",
-                                 "free global transaction table entry": "Other",
-                                 "library cache revalidation": "Other",
-                                 "library cache shutdown": "Other",
-                                 "BFILE closure": "Other",
-                                 "BFILE check if exists": "Other",
-                                 "BFILE check if open": "Other",
-                                 "BFILE get length": "Other",
-                                 "BFILE get name object": "Other",
-                                 "BFILE get path object": "Other",
-                                 "BFILE open": "Other",
-                                 "BFILE internal seek": "Other",
-                                 "waiting to get CAS latch": "Other",
-                                 "waiting to get RM CAS latch": "Other",
-                                 "resmgr:internal state cleanup": "Other",
-                                 "xdb schema cache initialization": "Other",
-                                 "ASM cluster file access": "Other",
-                                 "CSS initialization": "Other",
-                                 "CSS group registration": "Other",
-                                 "CSS group membership query": "Other",
-                                 "CSS operation: data query": "Other",
-                                 "CSS operation: data update": "Other",
-                                 "CSS Xgrp shared operation": "Other",
-                                 "CSS operation: query": "Other",
-                                 "CSS operation: action": "Other",
-                                 "CSS operation: diagnostic": "Other",
-                                 "GIPC operation: dump": "Other",
-                                 "GPnP Initialization": "Other",
-                                 "GPnP Termination": "Other",
-                                 "GPnP Get Item": "Other",
-                                 "GPnP Set Item": "Other",
-                                 "GPnP Get Error": "Other",
-                                 "ADR file lock": "Other",
-                                 "ADR block file read": "Other",
-                                 "ADR block file write": "Other",
-                                 "CRS call completion": "Other",
-                                 "dispatcher shutdown": "Other",
-                                 "listener registration dump": "Other",
-                                 "latch: virtual circuit queues": "Other",
-                                 "listen endpoint status": "Other",
-                                 "OJVM: Generic": "Other",
-                                 "select wait": "Other",
-                                 "jobq slave shutdown wait": "Other",
-                                 "jobq slave TJ process wait": "Other",
-                                 "job scheduler coordinator slave wait": "Other",
-                                 "enq: JD - contention": "Other",
-                                 "enq: JQ - contention": "Other",
-                                 "enq: OD - Serializing DDLs": "Other",
-                                 "RAC referential constraint parent lock": "Other",
-                                 "RAC: constraint DDL lock": "Other",
-                                 "kkshgnc reloop": "Other",
-                                 "optimizer stats update retry": "Other",
-                                 "wait active processes": "Other",
-                                 "SUPLOG PL wait for inflight pragma-d PL/SQL": "Other",
-                                 "enq: MD - contention": "Other",
-                                 "enq: MS - contention": "Other",
-                                 "wait for kkpo ref-partitioning *TEST EVENT*": "Other",
-                                 "enq: AP - contention": "Other",
-                                 "PX slave connection": "Other",
-                                 "PX slave release": "Other",
-                                 "PX Send Wait": "Other",
-                                 "PX qref latch": "Other",
-                                 "PX server shutdown": "Other",
-                                 "PX create server": "Other",
-                                 "PX signal server": "Other",
-                                 "PX Deq Credit: free buffer": "Other",
-                                 "PX Deq: Test for msg": "Other",
-                                 "PX Deq: Test for credit": "Other",
-                                 "PX Deq: Signal ACK RSG": "Other",
-                                 "PX Deq: Signal ACK EXT": "Other",
-                                 "PX Deq: reap credit": "Other",
-                                 "PX Nsq: PQ descriptor query": "Other",
-                                 "PX Nsq: PQ load info query": "Other",
-                                 "PX Deq Credit: Session Stats": "Other",
-                                 "PX Deq: Slave Session Stats": "Other",
-                                 "PX Deq: Slave Join Frag": "Other",
-                                 "enq: PI - contention": "Other",
-                                 "enq: PS - contention": "Other",
-                                 "latch: parallel query alloc buffer": "Other",
-                                 "kxfxse": "Other",
-                                 "kxfxsp": "Other",
-                                 "PX Deq: Table Q qref": "Other",
-                                 "PX Deq: Table Q Get Keys": "Other",
-                                 "PX Deq: Table Q Close": "Other",
-                                 "GV$: slave acquisition retry wait time": "Other",
-                                 "PX hash elem being inserted": "Other",
-                                 "latch: PX hash array latch": "Other",
-                                 "enq: AY - contention": "Other",
-                                 "enq: TO - contention": "Other",
-                                 "enq: IT - contention": "Other",
-                                 "enq: BF - allocation contention": "Other",
-                                 "enq: BF - PMON Join Filter cleanup": "Other",
-                                 "enq: RD - RAC load": "Other",
-                                 "enq: KV - key vector creation coordination": "Other",
-                                 "timer in sksawat": "Other",
-                                 "scginq AST call": "Other",
-                                 "kupp process wait": "Other",
-                                 "Kupp process shutdown": "Other",
-                                 "Data Pump slave startup": "Other",
-                                 "Data Pump slave init": "Other",
-                                 "enq: KP - contention": "Other",
-                                 "Replication Dequeue ": "Other",
-                                 "knpc_acwm_AwaitChangedWaterMark": "Other",
-                                 "knpc_anq_AwaitNonemptyQueue": "Other",
-                                 "knpsmai": "Other",
-                                 "enq: SR - contention": "Other",
-                                 "REPL Capture/Apply: database startup": "Other",
-                                 "REPL Capture/Apply: miscellaneous": "Other",
-                                 "enq: SI - contention": "Other",
-                                 "REPL Capture/Apply: RAC inter-instance ack": "Other",
-                                 "enq: IA - contention": "Other",
-                                 "enq: JI - contention": "Other",
-                                 "qerex_gdml": "Other",
-                                 "enq: AT - contention": "Other",
-                                 "opishd": "Other",
-                                 "kpodplck wait before retrying ORA-54": "Other",
-                                 "enq: CQ - contention": "Other",
-                                 "wait for EMON to spawn": "Other",
-                                 "EMON termination": "Other",
-                                 "Emon coordinator startup": "Other",
-                                 "enq: SE - contention": "Other",
-                                 "tsm with timeout": "Other",
-                                 "Streams AQ: waiting for busy instance for instance_name": "Other",
-                                 "enq: TQ - TM contention": "Other",
-                                 "enq: TQ - DDL contention": "Other",
-                                 "enq: TQ - INI contention": "Other",
-                                 "enq: TQ - DDL-INI contention": "Other",
-                                 "enq: TQ - INI sq contention": "Other",
-                                 "enq: TQ - MC free sync at cross job start": "Other",
-                                 "enq: TQ - MC free sync at cross job stop": "Other",
-                                 "enq: TQ - MC free sync at cross job end": "Other",
-                                 "enq: TQ - MC free sync at export subshard": "Other",
-                                 "enq: TQ -  sq TM contention": "Other",
-                                 "AQ reload SO release": "Other",
-                                 "enq: RQ - Enqueue commit uncached": "Other",
-                                 "enq: RQ - Enqueue commit cached": "Other",
-                                 "enq: RQ - Dequeue update scn": "Other",
-                                 "enq: RQ - Parallel cross update scn": "Other",
-                                 "enq: RQ - Cross update scn": "Other",
-                                 "enq: RQ - Trucate subshard": "Other",
-                                 "enq: RQ - Cross export subshard": "Other",
-                                 "enq: RQ - Cross import subshard": "Other",
-                                 "enq: RQ - Free shadow shard": "Other",
-                                 "enq: RQ - AQ indexed cached commit": "Other",
-                                 "enq: RQ - AQ uncached commit WM update": "Other",
-                                 "enq: RQ - AQ uncached dequeue": "Other",
-                                 "enq: RQ - AQ Eq Ptn Mapping": "Other",
-                                 "enq: RQ - AQ Dq Ptn Mapping": "Other",
-                                 "enq: RQ - AQ Trnc mem free": "Other",
-                                 "enq: RQ - AQ Trnc mem free remote": "Other",
-                                 "enq: RQ - AQ Trnc mem free by LB": "Other",
-                                 "enq: RQ - AQ Trnc mem free by CP": "Other",
-                                 "enq: RQ - AQ Enq commit incarnation wrap": "Other",
-                                 "enq: RQ - AQ Rule evaluation segment load": "Other",
-                                 "AQ propagation connection": "Other",
-                                 "enq: DP - contention": "Other",
-                                 "enq: MH - contention": "Other",
-                                 "enq: ML - contention": "Other",
-                                 "enq: PH - contention": "Other",
-                                 "enq: SF - contention": "Other",
-                                 "enq: XH - contention": "Other",
-                                 "enq: WA - contention": "Other",
-                                 "Streams AQ: QueueTable kgl locks": "Other",
-                                 "AQ spill debug idle": "Other",
-                                 "AQ master shutdown": "Other",
-                                 "AQPC: new master": "Other",
-                                 "AQ Background Master: slave start": "Other",
-                                 "enq: AQ - QPT fg map dqpt": "Other",
-                                 "enq: AQ - QPT fg map qpt": "Other",
-                                 "enq: PQ - QPT add qpt": "Other",
-                                 "enq: PQ - QPT drop qpt": "Other",
-                                 "enq: PQ - QPT add dqpt": "Other",
-                                 "enq: PQ - QPT drop dqpt": "Other",
-                                 "enq: PQ - QPT add qpt fg": "Other",
-                                 "enq: PQ - QPT add dqpt fg": "Other",
-                                 "enq: PQ - QPT Trunc": "Other",
-                                 "enq: PQ - QPT LB Trunc sync": "Other",
-                                 "enq: PQ - QPT XSTART Trunc sync": "Other",
-                                 "AQ master: time mgmt/task cleanup": "Other",
-                                 "AQ slave: time mgmt/task cleanup": "Other",
-                                 "enq: BA - SUBBMAP contention": "Other",
-                                 "AQ:non durable subscriber add or drop": "Other",
-                                 "enq: CX - TEXT: Index Specific Lock": "Other",
-                                 "enq: OT - TEXT: Generic Lock": "Other",
-                                 "XDB SGA initialization": "Other",
-                                 "enq: XC - XDB Configuration": "Other",
-                                 "NFS read delegation outstanding": "Other",
-                                 "Data Guard Broker Wait": "Other",
-                                 "enq: RF - synch: DG Broker metadata": "Other",
-                                 "enq: RF - atomicity": "Other",
-                                 "enq: RF - synchronization: aifo master": "Other",
-                                 "enq: RF - new AI": "Other",
-                                 "enq: RF - synchronization: critical ai": "Other",
-                                 "enq: RF - RF - Database Automatic Disable": "Other",
-                                 "enq: RF - FSFO Observer Heartbeat": "Other",
-                                 "enq: RF - DG Broker Current File ID": "Other",
-                                 "enq: RF - FSFO Primary Shutdown suspended": "Other",
-                                 "enq: RF - Broker State Lock": "Other",
-                                 "enq: RF - FSFO string buffer": "Other",
-                                 "PX Deq: OLAP Update Reply": "Other",
-                                 "PX Deq: OLAP Update Execute": "Other",
-                                 "PX Deq: OLAP Update Close": "Other",
-                                 "OLAP Parallel Type Deq": "Other",
-                                 "OLAP Parallel Temp Grow Request": "Other",
-                                 "OLAP Parallel Temp Grow Wait": "Other",
-                                 "OLAP Parallel Temp Grew": "Other",
-                                 "OLAP Null PQ Reason": "Other",
-                                 "OLAP Aggregate Master Enq": "Other",
-                                 "OLAP Aggregate Client Enq": "Other",
-                                 "OLAP Aggregate Master Deq": "Other",
-                                 "OLAP Aggregate Client Deq": "Other",
-                                 "enq: AW - AW$ table lock": "Other",
-                                 "enq: AW - AW state lock": "Other",
-                                 "enq: AW - user access for AW": "Other",
-                                 "enq: AW - AW generation lock": "Other",
-                                 "enq: AG - contention": "Other",
-                                 "enq: AO - contention": "Other",
-                                 "enq: OQ - xsoqhiAlloc": "Other",
-                                 "enq: OQ - xsoqhiFlush": "Other",
-                                 "enq: OQ - xsoq*histrecb": "Other",
-                                 "enq: OQ - xsoqhiClose": "Other",
-                                 "enq: OQ - xsoqhistrecb": "Other",
-                                 "enq: IZ -  contention": "Other",
-                                 "enq: AM - client registration": "Other",
-                                 "enq: AM - shutdown": "Other",
-                                 "enq: AM - rollback COD reservation": "Other",
-                                 "enq: AM - background COD reservation": "Other",
-                                 "enq: AM - ASM cache freeze": "Other",
-                                 "enq: AM - ASM ACD Relocation": "Other",
-                                 "enq: AM - group use": "Other",
-                                 "enq: AM - group block": "Other",
-                                 "enq: AM - ASM File Destroy": "Other",
-                                 "enq: AM - ASM User": "Other",
-                                 "enq: AM - ASM Password File Update": "Other",
-                                 "enq: AM - ASM Amdu Dump": "Other",
-                                 "enq: AM - disk offline": "Other",
-                                 "enq: AM - ASM reserved": "Other",
-                                 "enq: AM - block repair": "Other",
-                                 "enq: AM - ASM disk based alloc/dealloc": "Other",
-                                 "enq: AM - ASM file descriptor": "Other",
-                                 "enq: AM - ASM file relocation": "Other",
-                                 "enq: AM - ASM SR relocation": "Other",
-                                 "enq: AM - ASM Grow ACD": "Other",
-                                 "enq: AM - ASM DD update SrRloc": "Other",
-                                 "enq: AM - ASM file chown": "Other",
-                                 "enq: AM - Register with IOServer": "Other",
-                                 "enq: AM - ASM metadata replication": "Other",
-                                 "enq: AM - SR slice Clear/Mark": "Other",
-                                 "enq: AM - Enable Remote ASM": "Other",
-                                 "enq: AM - Disable Remote ASM": "Other",
-                                 "enq: AM - Credential creation": "Other",
-                                 "enq: AM - Credential deletion": "Other",
-                                 "enq: AM - ASM file access req": "Other",
-                                 "enq: AM - ASM client operation": "Other",
-                                 "enq: AM - ASM client check": "Other",
-                                 "enq: AM - ASM ATB COD creation": "Other",
-                                 "enq: AM - Create default DG key in OCR": "Other",
-                                 "enq: AM - ASM Audit file Delete": "Other",
-                                 "enq: AM - ASM Audit file Cleanup": "Other",
-                                 "enq: AM - ASM VAT migration": "Other",
-                                 "enq: AM - Update SR nomark flag": "Other",
-                                 "enq: AM - ASM VAL cache": "Other",
-                                 "enq: AM - ASM SR Segment Reuse": "Other",
-                                 "ASM internal hang test": "Other",
-                                 "ASM Instance startup": "Other",
-                                 "buffer busy": "Other",
-                                 "buffer freelistbusy": "Other",
-                                 "buffer rememberlist busy": "Other",
-                                 "buffer writeList full": "Other",
-                                 "no free buffers": "Other",
-                                 "buffer write wait": "Other",
-                                 "buffer invalidation wait": "Other",
-                                 "buffer dirty disabled": "Other",
-                                 "ASM metadata cache frozen": "Other",
-                                 "enq: FZ -  contention": "Other",
-                                 "enq: CM - gate": "Other",
-                                 "enq: CM - instance": "Other",
-                                 "enq: CM - diskgroup dismount": "Other",
-                                 "enq: XQ - recovery": "Other",
-                                 "enq: XQ - relocation": "Other",
-                                 "enq: XQ - purification": "Other",
-                                 "enq: AD - allocate AU": "Other",
-                                 "enq: AD - deallocate AU": "Other",
-                                 "enq: AD - relocate AU": "Other",
-                                 "enq: DO - disk online": "Other",
-                                 "enq: DO - disk online recovery": "Other",
-                                 "enq: DO - Staleness Registry create": "Other",
-                                 "enq: DO - startup of MARK process": "Other",
-                                 "extent map load/unlock": "Other",
-                                 "enq: XL - fault extent map": "Other",
-                                 "Sync ASM rebalance": "Other",
-                                 "Sync ASM discovery": "Other",
-                                 "enq: DG - contention": "Other",
-                                 "enq: DD - contention": "Other",
-                                 "enq: HD - contention": "Other",
-                                 "enq: DQ -  contention": "Other",
-                                 "enq: DN - contention": "Other",
-                                 "Cluster stabilization wait": "Other",
-                                 "Cluster Suspension wait": "Other",
-                                 "ASM background starting": "Other",
-                                 "ASM db client exists": "Other",
-                                 "ASM file metadata operation": "Other",
-                                 "ASM network foreground exits": "Other",
-                                 "enq: XB -  contention": "Other",
-                                 "enq: FA - access file": "Other",
-                                 "enq: RX - relocate extent": "Other",
-                                 "enq: RX - unlock extent": "Other",
-                                 "enq: AR -  contention": "Other",
-                                 "enq: AH -  contention": "Other",
-                                 "log write(odd)": "Other",
-                                 "log write(even)": "Other",
-                                 "checkpoint advanced": "Other",
-                                 "enq: FR - contention": "Other",
-                                 "enq: FR - use the thread": "Other",
-                                 "enq: FR - recover the thread": "Other",
-                                 "enq: FG - serialize ACD relocate": "Other",
-                                 "enq: FG - FG redo generation enq race": "Other",
-                                 "enq: FG - LGWR redo generation enq race": "Other",
-                                 "enq: FT - allow LGWR writes": "Other",
-                                 "enq: FT - disable LGWR writes": "Other",
-                                 "enq: FC - open an ACD thread": "Other",
-                                 "enq: FC - recover an ACD thread": "Other",
-                                 "enq: FX - issue ACD Xtnt Relocation CIC": "Other",
-                                 "rollback operations block full": "Other",
-                                 "rollback operations active": "Other",
-                                 "enq: RB - contention": "Other",
-                                 "ASM: MARK subscribe to msg channel": "Other",
-                                 "ASM: Send msg to MARK": "Other",
-                                 "call": "Other",
-                                 "enq: IC - IOServer clientID": "Other",
-                                 "enq: IF - file open": "Other",
-                                 "enq: IF - file close": "Other",
-                                 "enq: PT - contention": "Other",
-                                 "enq: PT - ASM Storage May Split": "Other",
-                                 "enq: PM -  contention": "Other",
-                                 "ASM PST operation": "Other",
-                                 "global cache busy": "Other",
-                                 "lock release pending": "Other",
-                                 "dma prepare busy": "Other",
-                                 "GCS lock cancel": "Other",
-                                 "GCS lock open S": "Other",
-                                 "GCS lock open X": "Other",
-                                 "GCS lock open": "Other",
-                                 "GCS lock cvt S": "Other",
-                                 "GCS lock cvt X": "Other",
-                                 "GCS lock esc X": "Other",
-                                 "GCS lock esc": "Other",
-                                 "GCS recovery lock open": "Other",
-                                 "GCS recovery lock convert": "Other",
-                                 "kfcl: instance recovery": "Other",
-                                 "no free locks": "Other",
-                                 "lock close": "Other",
-                                 "enq: KE -  contention": "Other",
-                                 "enq: KQ - access ASM attribute": "Other",
-                                 "ASM Volume Background": "Other",
-                                 "ASM volume directive send": "Other",
-                                 "ASM Volume Resource Action": "Other",
-                                 "enq: AV - persistent DG number": "Other",
-                                 "enq: AV - volume relocate": "Other",
-                                 "enq: AV - AVD client registration": "Other",
-                                 "enq: AV - add/enable first volume in DG": "Other",
-                                 "ASM: OFS Cluster membership update": "Other",
-                                 "ASM Scrubbing I/O": "Other",
-                                 "enq: WF - contention": "Other",
-                                 "enq: WT - contention": "Other",
-                                 "enq: WP - contention": "Other",
-                                 "enq: FU - contention": "Other",
-                                 "enq: MW - contention": "Other",
-                                 "AWR Flush": "Other",
-                                 "AWR Metric Capture": "Other",
-                                 "enq: TB - SQL Tuning Base Cache Update": "Other",
-                                 "enq: TB - SQL Tuning Base Cache Load": "Other",
-                                 "enq: SH - contention": "Other",
-                                 "enq: AF - task serialization": "Other",
-                                 "MMON slave messages": "Other",
-                                 "MMON (Lite) shutdown": "Other",
-                                 "enq: MO - contention": "Other",
-                                 "enq: TL - contention": "Other",
-                                 "enq: TH - metric threshold evaluation": "Other",
-                                 "enq: TK - Auto Task Serialization": "Other",
-                                 "enq: TK - Auto Task Slave Lockout": "Other",
-                                 "enq: RR - contention": "Other",
-                                 "WCR: RAC message context busy": "Other",
-                                 "WCR: capture file IO write": "Other",
-                                 "WCR: Sync context busy": "Other",
-                                 "latch: WCR: sync": "Other",
-                                 "latch: WCR: processes HT": "Other",
-                                 "enq: RA - RT ADDM flood control": "Other",
-                                 "enq: JS - contention": "Other",
-                                 "enq: JS - job run lock - synchronize": "Other",
-                                 "enq: JS - job recov lock": "Other",
-                                 "enq: JS - queue lock": "Other",
-                                 "enq: JS - sch locl enqs": "Other",
-                                 "enq: JS - q mem clnup lck": "Other",
-                                 "enq: JS - evtsub add": "Other",
-                                 "enq: JS - evtsub drop": "Other",
-                                 "enq: JS - wdw op": "Other",
-                                 "enq: JS - evt notify": "Other",
-                                 "enq: JS - aq sync": "Other",
-                                 "enq: XD - ASM disk drop/add": "Other",
-                                 "enq: XD - ASM disk ONLINE": "Other",
-                                 "enq: XD - ASM disk OFFLINE": "Other",
-                                 "cell worker online completion": "Other",
-                                 "cell worker retry ": "Other",
-                                 "cell manager cancel work request": "Other",
-                                 "opening cell offload device": "Other",
-                                 "ioctl to cell offload device": "Other",
-                                 "reap block level offload operations": "Other",
-                                 "CDB: Per Instance Query for PDB Info": "Other",
-                                 "enq: PB - PDB Lock": "Other",
-                                 "secondary event": "Other"}
-
         self.load_profile_sec = ["DB Time", "DB CPU"]
         self.load_profile_mb = ["Redo size", "Read IO", "Write IO", "SQL Work Area"]
         self.load_profile_blk = ["Logical read", "Physical read", "Physical write", "Block changes"]
+        # reports older than 11.2.0.4 use plural names for the block statistics
+        self.load_profile_blk_old = ["Logical reads", "Physical reads", "Physical writes", "Block changes"]
         self.load_profile_num = ["Read IO requests", "Write IO requests", "User calls", "Parses",
                                  "Hard parses", "Logons", "Executes", "Rollbacks", "Transactions", "Sessions (Begin)",
                                  "Sessions (End)"]
@@ -1679,661 +1089,691 @@ class AWRAnalyzer(object):
                                   self.load_profile_mb + self.load_profile_blk + self.load_profile_num
 
 
-    def get_class_name(self, event_name_short):
-        for event_name in self.event_class_name:
-            if event_name.startswith(event_name_short):
-                # if event_name_short == "db flash cache single bloc":
-                #     print(event_name, self.event_class_name[event_name])
-                return self.event_class_name[event_name]
+    def get_class_name(self, event_name_short, version=()):
+        return get_event_catalog(version).get_class_name(event_name_short)
 
-        return "NONE"
+    def get_report_files(self):
+        report_files = []
+        for fname in os.listdir(self.dirname):
+            if fname.endswith(ARCHIVE_SUFFIXES) or self.is_report_name(fname):
+                report_files.append(fname)
 
-    def is_float(self, val):
-        try:
-            x = float(val.replace(",", ""))
-            return True
-        except:
-            return False
+        return report_files
 
-    def plot(self):
+    def is_report_name(self, fname):
+        for suffix, opener in COMPRESSED_OPENERS:
+            if fname.endswith(suffix):
+                fname = fname[:-len(suffix)]
+                break
 
-        snap_data = {}
-        snap_data_profile = {}
-        snap_data_cpu = {}
-        snap_data_sql_ela = {}
-        snap_data_inst_stats = {}
-        snap_data_time_model = {}
-        snap_data_event_ela = {}
-        sql_ids = {}
-        snap_data_io_avg = {}
+        return fname.endswith("txt") and fname.find(self.name_pattern) >= 0
 
+    def parse_report(self, fname, report_file=None, sections=None):
+        # Parses a single report into a self-contained snapshot record, so reports can be parsed in any
+        # process and merged afterwards. Nothing on self is modified here.
+        path = os.path.join(self.dirname, fname)
+        try:
+            for suffix, opener in COMPRESSED_OPENERS:
+                if fname.endswith(suffix):
+                    report_file = opener(report_file or path)
+                    break
+            report_file = ReportReader(path, report_file)
+        except Exception as e:
+            print(fname, str(e))
+            raise
+
+        return ReportParser(self, fname, sections).parse(report_file)
+
+    def parse_file(self, fname, sections=None):
+        # Returns the snapshot records of a report file, or of every matching report in an archive
+        if not fname.endswith(ARCHIVE_SUFFIXES):
+            return [self.parse_report(fname, None, sections)]
+
+        snaps = []
+        path = os.path.join(self.dirname, fname)
+        if fname.endswith(".zip"):
+            with zipfile.ZipFile(path) as archive:
+                for member in archive.infolist():
+                    if not member.is_dir() and self.is_report_name(os.path.basename(member.filename)):
+                        snaps.append(self.parse_report(fname + "/" + member.filename, archive.open(member),
+                                                     sections))
+        else:
+            # read as a stream, so a compressed tar is decompressed once from start to end
+            with tarfile.open(path, "r|*") as archive:
+                for member in archive:
+                    if member.isfile() and self.is_report_name(os.path.basename(member.name)):
+                        snaps.append(self.parse_report(fname + "/" + member.name, archive.extractfile(member),
+                                                     sections))
+
+        return snaps
+
+    def parse_files(self, report_files, sections=None):
+        if self.jobs > 1 and len(report_files) > 1:
+            chunksize = max(1, len(report_files) // (self.jobs * 4))
+            pool = multiprocessing.Pool(self.jobs)
+            try:
+                for snaps in pool.imap(functools.partial(self.parse_file, sections=sections), report_files,
+                                       chunksize):
+                    yield snaps
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for fname in report_files:
+                yield self.parse_file(fname, sections)
+
+    def parse_report_files(self, report_files):
+        # Yields (file name, snapshot records) in os.listdir order, so merging them gives the same result for
+        # every number of jobs and whether or not they come from the cache.
+        if self.cache is None:
+            for fname, snaps in zip(report_files, self.parse_files(report_files)):
+                yield fname, snaps
+            return
+
+        cache = self.load_index(self.cache)
+        sections = self.sections
+        cached = {}
+        for fname in report_files:
+            cached[fname] = self.get_cached_snaps(cache, fname, sections)
+        self.cache_hits = len(report_files) - list(cached.values()).count(None)
+
+        parsed = self.parse_files([fname for fname in report_files if cached[fname] is None])
+        for fname in report_files:
+            snaps = cached[fname]
+            if snaps is None:
+                snaps = next(parsed)
+                self.cache_snaps(cache, fname, sections, snaps)
+            yield fname, snaps
+
+        self.prune_index(cache)
+        self.save_index(cache, self.cache)
+
+    def parse_reports(self):
+        snaps = []
+        for fname, file_snaps in self.parse_report_files(self.select_report_files(self.get_unique_report_files())):
+            snaps.extend(snap for snap in self.get_complete_snaps(fname, file_snaps) if self.is_selected(snap))
+
+        return self.resolve_overlaps(snaps)
+
+    def get_complete_snaps(self, fname, file_snaps):
+        # a report without a Begin Snap line (cut short or not an AWR report) has no snapshot to chart
+        complete = [snap for snap in file_snaps if snap["date"] is not None]
+        if len(complete) < len(file_snaps):
+            print("skipped %d report(s) without a snapshot in %s" % (len(file_snaps) - len(complete), fname))
+        return complete
+
+    def get_unique_report_files(self):
+        # Byte-identical copies of a report file are read only once, the first one in os.listdir order. Only
+        # files of the same size are hashed.
+        report_files = self.get_report_files()
+        sizes = {}
+        for fname in report_files:
+            sizes.setdefault(os.path.getsize(os.path.join(self.dirname, fname)), []).append(fname)
+
+        duplicates = set()
+        for fnames in sizes.values():
+            if len(fnames) > 1:
+                digests = set()
+                for fname in fnames:
+                    digest = self.get_digest(os.path.join(self.dirname, fname))
+                    if digest in digests:
+                        duplicates.add(fname)
+                    digests.add(digest)
+
+        if self.timings and duplicates:
+            print("skipped %d duplicate report files" % len(duplicates))
+        return [fname for fname in report_files if fname not in duplicates]
+
+    def resolve_overlaps(self, snaps):
+        # Of the reports of one database and instance whose snapshot ranges overlap, only the ones covering the
+        # fewest snapshots are kept, so reports over several snapshots do not double the hourly ones. Of equal
+        # ranges the last one is kept, as a later report of the same snapshot always replaced the earlier one.
+        # snaps may be records or catalogue headers, the ones kept are returned in their order.
+        ranks = []
+        for i, snap in enumerate(snaps):
+            begin = parse_int(snap["begin_snap_id"])
+            ranks.append((parse_int(snap["end_snap_id"]) - begin, begin, -i))
+
+        # the kept ranges of every database and instance, sorted and not overlapping
+        ranges = {}
+        kept = set()
+        for span, begin, minus_i in sorted(ranks):
+            i = -minus_i
+            if span > 0:
+                begins, ends = ranges.setdefault((parse_int(snaps[i]["dbid"]), parse_int(snaps[i]["inst_num"])),
+                                                 ([], []))
+                j = bisect.bisect_right(begins, begin)
+                if (j and ends[j - 1] > begin) or (j < len(begins) and begins[j] < begin + span):
+                    continue
+                begins.insert(j, begin)
+                ends.insert(j, begin + span)
+            kept.add(i)
+
+        return [snap for i, snap in enumerate(snaps) if i in kept]
+
+    def is_selected(self, snap):
+        if self.time_from is not None and (snap["begin_time"] is None or snap["begin_time"] < self.time_from):
+            return False
+        if self.time_to is not None and (snap["begin_time"] is None or snap["begin_time"] >= self.time_to):
+            return False
+        if self.dbid is not None and snap["dbid"] != self.dbid:
+            return False
+        if self.instance is not None and self.instance not in (snap["instance"], snap["inst_num"]):
+            return False
+        return True
+
+    def select_report_files(self, report_files):
+        # Drops the files that hold no selected report, judging by the snapshot catalogue: the header fields of
+        # every report, read only up to the End Snap line and kept in the catalog file between runs. Archives
+        # are catalogued member by member, but read whole as soon as one member is selected.
+        if self.catalog is None and (self.time_from, self.time_to, self.dbid, self.instance) == (None,) * 4:
+            return report_files
+
+        select_start = time.time()
+        catalog = self.load_index(self.catalog)
+        headers = {}
+        for fname in report_files:
+            path = os.path.abspath(os.path.join(self.dirname, fname))
+            entry = catalog["reports"].get(path)
+            if entry is not None and (entry["size"], entry["mtime"]) == self.get_file_state(fname):
+                headers[fname] = entry["headers"]
+
+        missing = [fname for fname in report_files if fname not in headers]
+        for fname, snaps in zip(missing, self.parse_files(missing, CATALOG_PLAN)):
+            headers[fname] = [dict((field, snap[field]) for field in CATALOG_FIELDS) for snap in snaps]
+            size, mtime = self.get_file_state(fname)
+            catalog["reports"][os.path.abspath(os.path.join(self.dirname, fname))] = {"size": size,
+                                                                                      "mtime": mtime,
+                                                                                      "headers": headers[fname]}
+        # only a catalog that changed is written back
+        if self.catalog is not None and (self.prune_index(catalog) or missing):
+            self.save_index(catalog, self.catalog)
+
+        kept = set(id(header) for header in self.resolve_overlaps([header for fname in report_files
+                                                                   for header in headers[fname]
+                                                                   if self.is_selected(header)]))
+        selected = [fname for fname in report_files if any(id(header) in kept for header in headers[fname])]
+        if self.timings:
+            print("selected %d of %d report files in %.2fs (%d catalogued)" % (len(selected), len(report_files),
+                                                                             time.time() - select_start,
+                                                                             len(missing)))
+        return selected
+
+    def load_index(self, path):
+        # The cache and the catalog are JSON files of per report file entries
+        index = None
+        if path is not None:
+            try:
+                with open(path) as index_file:
+                    index = json.load(index_file)
+            except (IOError, ValueError):
+                pass
+
+        # parsed reports depend on the event classes too, changing them discards the index
+        event_classes = hashlib.sha1(repr(load_event_classes()).encode()).hexdigest()
+        if index is None or index.get("parser_version") != PARSER_VERSION \
+                or index.get("event_classes") != event_classes:
+            index = {"parser_version": PARSER_VERSION, "event_classes": event_classes, "reports": {}}
+        return index
+
+    def prune_index(self, index):
+        # Drops the entries of the report files gone from dirname and returns how many. The entries of files
+        # left out by the filters are kept for the next run.
+        dirname = os.path.abspath(self.dirname)
+        gone = [path for path in index["reports"] if os.path.dirname(path) == dirname and not os.path.exists(path)]
+        for path in gone:
+            del index["reports"][path]
+        return len(gone)
+
+    def save_index(self, index, path):
+        index_tmp = path + ".tmp"
+        with open(index_tmp, "w") as index_file:
+            json.dump(index, index_file)
+        os.replace(index_tmp, path)
+
+    def get_cached_snaps(self, cache, fname, sections):
+        # A report whose size and mtime did not change is taken from the cache as is. If they did, the content
+        # hash decides, so a report that was only copied or touched is not parsed again.
+        path = os.path.abspath(os.path.join(self.dirname, fname))
+        entry = cache["reports"].get(path)
+        if entry is None or not set(sections) <= set(entry["sections"]):
+            return None
+
+        stat = os.stat(path)
+        if (entry["size"], entry["mtime"]) != (stat.st_size, stat.st_mtime_ns):
+            if entry["size"] != stat.st_size or entry["digest"] != self.get_digest(path):
+                return None
+            entry["mtime"] = stat.st_mtime_ns
+
+        return entry["snaps"]
+
+    def cache_snaps(self, cache, fname, sections, snaps):
+        path = os.path.abspath(os.path.join(self.dirname, fname))
+        stat = os.stat(path)
+        cache["reports"][path] = {"size": stat.st_size,
+                                  "mtime": stat.st_mtime_ns,
+                                  "digest": self.get_digest(path),
+                                  "sections": list(sections),
+                                  "snaps": snaps}
+
+    def get_digest(self, path):
+        digest = hashlib.sha1()
+        with open(path, "rb") as report_file:
+            for chunk in iter(lambda: report_file.read(REPORT_BUFFER_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
 
-        for fname in os.listdir(self.dirname):
-            if fname.endswith("txt") and fname.find(self.name_pattern) >= 0:
+    def plot(self):
+        series = self.new_series()
+
+        parse_start = time.time()
+        report_count = 0
+        for snap in self.parse_reports():
+            report_count += 1
+            self.add_snap(series, snap)
+
+        if self.timings:
+            print("parsed %d reports in %.2fs (%d from cache)" % (report_count, time.time() - parse_start,
+                                                                   self.cache_hits))
+
+        if not series.rows:
+            print("no reports matching %s selected in %s" % (self.name_pattern, self.dirname))
+            sys.exit(1)
+        self.render(series)
+
+    def watch(self, interval, debounce):
+        # Polls dirname every interval seconds and parses only reports that are new or changed since the last
+        # poll. The charts are written again once no report has changed for debounce seconds.
+        series = self.new_series()
+        snaps = {}
+        merged = {}
+        seen = {}
+        for fname, file_snaps in self.parse_report_files(self.select_report_files(self.get_unique_report_files())):
+            snaps[fname] = [snap for snap in self.get_complete_snaps(fname, file_snaps) if self.is_selected(snap)]
+            seen[fname] = self.get_file_state(fname)
+        self.merge_snaps(series, snaps, merged)
+        if series.rows:
+            self.render(series)
+
+        last_change = None
+        try:
+            while True:
+                time.sleep(interval)
+                states = dict((fname, self.get_file_state(fname)) for fname in self.get_report_files())
+                report_files = [fname for fname, state in states.items()
+                                if state is not None and seen.get(fname) != state]
+                # a report still being spooled fails to parse or has no snapshot yet, try again next time
                 try:
-                    report_file = open(self.dirname + "/" + fname, "r").readlines()
-                except Exception as e:
-                    print(fname, str(e))
-                    raise
-                wait_class_section = False
-                load_profile_section = False
-                host_cpu_section = False
-                top_sql_ela = False
-                top_sql_ela_ignore = False
-                time_model_section = False
-                instance_stats_section = False
-
-                event_class_wait_sum = {}
-                db_version = "12"
-                line_of_db_version = 6
-                line_no = 0
-                section_line = 0
-                profile_pos = 0
-                for report_line in report_file:
-                    line_no += 1
-                    try:
-                        report_line_words = report_line.split()
-                        report_line_long_words = re.split("\s{2,}", report_line)
-                        section_line += 1
-
-                        if line_no == 2 and report_line.find("WARNING") >= 0:
-                            line_of_db_version = 10
-
-                        elif line_no == line_of_db_version:
-                            db_version = report_line_words[6]
-                            if db_version < "11.2.0.4.0":
-                                self.load_profile_blk = ["Logical reads", "Physical reads", "Physical writes",
-                                                         "Block changes"]
-                                self.load_profile_elems = self.load_profile_sec + self.load_profile_mb + \
-                                                          self.load_profile_blk + self.load_profile_num
-
-                        elif report_line.find("Begin Snap:") >= 0:
-                            date = report_line.split()[3] + " " + report_line.split()[4]
-                            date = datetime.strptime(date, "%d-%b-%y %H:%M:%S").strftime("%Y%m%d:%H:%M")
-                            date = date + " (" + report_line.split()[2] + ")"
-                            snap_data[date] = {}
-                            snap_data_profile[date] = {}
-                            snap_data_cpu[date] = {}
-                            snap_data_sql_ela[date] = {}
-                            snap_data_event_ela[date] = {}
-                            snap_data_io_avg[date] = {}
-
-                            snap_data_inst_stats[date] = {}
-                            snap_data_inst_stats[date]["temp space allocated (bytes)"] = 0
-                            snap_data_inst_stats[date]["index fast full scans (direct re"] = 0
-                            snap_data_inst_stats[date]["index fast full scans (full)"] = 0
-                            snap_data_inst_stats[date]["index fetch by key"] = 0
-                            snap_data_inst_stats[date]["index scans kdiixs"] = 0
-                            snap_data_inst_stats[date]["sorts (disk)"] = 0
-                            snap_data_inst_stats[date]["table fetch by rowid"] = 0
-                            snap_data_inst_stats[date]["table scans (direct read)"] = 0
-                            snap_data_inst_stats[date]["table scans (long tables)"] = 0
-                            snap_data_inst_stats[date]["table scans (short tables)"] = 0
-                            snap_data_inst_stats[date]["queries parallelized"] = 0
-                            snap_data_inst_stats[date]["cell scans"] = 0
-                            snap_data_inst_stats[date]["user calls"] = 0
-                            snap_data_inst_stats[date]["user commits"] = 0
-                            snap_data_inst_stats[date]["user commits/calls"] = 0
-
-                            snap_data_time_model[date] = {}
-                            snap_data_time_model[date]["parse time elapsed"] = 0
-                            snap_data_time_model[date]["sql execute elapsed time"] = 0
-                            snap_data_time_model[date]["hard parse elapsed time"] = 0
-                            snap_data_time_model[date]["failed parse elapsed time"] = 0
-                            snap_data_time_model[date]["connection management call elapsed time"] = 0
-                            snap_data_time_model[date]["hard parse (sharing criteria) elapsed time"] = 0
-                            snap_data_time_model[date]["PL/SQL execution elapsed time"] = 0
-                            snap_data_time_model[date]["PL/SQL compilation elapsed time"] = 0
-                            snap_data_time_model[date]["sequence load elapsed time"] = 0
-                            snap_data_time_model[date]["hard parse (bind mismatch) elapsed time"] = 0
-                            snap_data_time_model[date]["Java execution elapsed time"] = 0
-                            snap_data_time_model[date]["DB time"] = 0
-
-                            snap_data_profile[date]["Sessions (Begin)"] = int(report_line_words[5].replace(",", ""))
-
-                        elif not time_model_section and (report_line.startswith("Time Model") or
-                                                         report_line[1:].startswith("Time Model")):
-                            time_model_section = True
-
-                        elif not instance_stats_section and \
-                                (report_line.startswith("Instance Activity Stats") or
-                                 report_line[1:].startswith("Instance Activity Stats")):
-                            instance_stats_section = True
-
-                        elif time_model_section and \
-                                (report_line.startswith("Foreground Wait Events") or
-                                 report_line[1:].startswith("Foreground Wait Events") or
-                                 report_line.startswith(("Operating System Statistics"))):
-                            time_model_section = False
-                            wait_class_section = False
-
-                        elif instance_stats_section and (report_line.startswith("IOStat") or
-                                                         report_line.startswith("IO Stat")):
-                            instance_stats_section = False
-
-                        elif time_model_section:
-                            for tm in snap_data_time_model[date]:
-                                if report_line.startswith(tm):
-                                    tm_words = len(tm.split())
-                                    snap_data_time_model[date][tm] = float(report_line_words[tm_words].replace(",", ""))
-
-                        elif instance_stats_section:
-                            for ist in snap_data_inst_stats[date]:
-                                if report_line.startswith(ist):
-                                    ist_words = len(ist.split())
-                                    snap_data_inst_stats[date][ist] = float(report_line_words[ist_words+1].replace(",", ""))
-                                    if report_line.startswith("user commits") and snap_data_inst_stats[date]["user commits"] < snap_data_inst_stats[date]["user calls"]:
-                                        snap_data_inst_stats[date]["user commits/calls"] = snap_data_inst_stats[date]["user commits"] / snap_data_inst_stats[date]["user calls"]
-
-                        elif report_line.find("End Snap:") >= 0:
-                            snap_data_profile[date]["Sessions (End)"] = int(report_line_words[5].replace(",", ""))
-
-                        elif report_line.startswith("Load Profile"):
-                            load_profile_section = True
-
-                        elif db_version >= "11.2.0.4.0" and report_line.startswith("Wait Classes by Total Wait Time"):
-                            wait_class_section = True
-
-                        elif db_version == "11.2.0.3.0" and report_line.startswith("Foreground Wait Class"):
-                            wait_class_section = True
-
-                        elif db_version < "11.2.0.3.0" and report_line.find("Foreground Wait Events") >= 0:
-                            wait_class_section = True
-
-                        elif db_version == "11.2.0.3.0" and report_line[1:].startswith("Foreground Wait Events"):
-                            wait_class_section = False
-
-                        elif report_line.find("Host CPU") >= 0:
-                            host_cpu_section = True
-                            if db_version >= "11.2.0.4.0":
-                                wait_class_section = False
-                            else:
-                                self.cpu_count = report_line_words[3]
-
-                            for class_name in self.event_classes:
-                                if snap_data[date].get(class_name, -1) == -1:
-                                    snap_data[date][class_name] = 0
-
-                        elif db_version >= "11.2.0.4.0" and host_cpu_section and len(report_line_long_words) > 8 and \
-                                self.is_float(report_line_long_words[1]):
-                            if len(report_line_long_words) == 10:
-                                snap_data_cpu[date]["User"] = float(report_line_long_words[6])
-                                snap_data_cpu[date]["System"] = float(report_line_long_words[7])
-                                snap_data_cpu[date]["WIO"] = float(report_line_long_words[8])
-                                self.cpu_count = report_line_long_words[1]
-                            else:
-                                snap_data_cpu[date]["User"] = float(report_line_long_words[5])
-                                snap_data_cpu[date]["System"] = float(report_line_long_words[6])
-                                snap_data_cpu[date]["WIO"] = float(report_line_long_words[7])
-
-                            host_cpu_section = False
-
-                        elif db_version < "11.2.0.4.0" and host_cpu_section and len(report_line_long_words) > 5 and \
-                                self.is_float(report_line_long_words[1]):
-                            snap_data_cpu[date]["User"] = float(report_line_long_words[3])
-                            snap_data_cpu[date]["System"] = float(report_line_long_words[4])
-                            snap_data_cpu[date]["WIO"] = float(report_line_long_words[5])
-
-                            host_cpu_section = False
-
-                        elif load_profile_section and len(report_line_long_words) > 2:
-                            profile_pos += 1
-                            if profile_pos >= 2:
-                                load_elem = report_line.split(':')[0].split('(')[0].strip()
-                                load_val = report_line.split(':')[1].split()[0].replace(",", "")
-                                if load_elem in self.load_profile_elems:
-                                    if load_elem.startswith("Redo size"):
-                                        snap_data_profile[date][load_elem] = round(float(load_val) / 1024 / 1024, 2)
-                                    else:
-                                        snap_data_profile[date][load_elem] = float(load_val)
-
-                        elif report_line.startswith("Instance Efficiency"):
-                            load_profile_section = False
-                            profile_pos = 0
-
-                        elif db_version >= "11.2.0.3.0" and len(report_line_words) > 2 \
-                                and (report_line_words[0] + " " + report_line_words[1] in self.event_classes) \
-                                and wait_class_section \
-                                and report_line.startswith(report_line_words[0]):
-
-                            value_field = 3
-                            if db_version == "11.2.0.3.0":
-                                value_field += 1
-
-                            snap_data[date][report_line_words[0] + " " + report_line_words[1]] = \
-                                float(report_line_words[value_field].replace(",", ""))
-
-                            if report_line.startswith("User I/O"):
-                                avg_value = 0
-                                if report_line_words[4].find("ms") > 0:
-                                    avg_value = float(report_line_words[value_field+1].replace(",", "").strip("ms"))
-                                elif report_line_words[4].find("us") > 0:
-                                    avg_value = float(report_line_words[value_field+1].replace(",", "").strip("us")) / 1000
-                                else:
-                                    avg_value = float(report_line_words[value_field+1].replace(",", ""))
-
-                                snap_data_io_avg[date]["User I/O (avg ms)"] = avg_value
-
-                        elif db_version >= "11.2.0.3.0" and len(report_line_words) > 2 \
-                             and (report_line_words[0] in self.event_classes) \
-                             and wait_class_section \
-                             and report_line.startswith(report_line_words[0]):
-
-                            value_field = 2
-                            if db_version == "11.2.0.3.0":
-                                value_field += 1
-
-                            snap_data[date][report_line_words[0]] = float(report_line_words[value_field].replace(",", ""))
-
-                        elif db_version < "11.2.0.3.0" and wait_class_section and len(report_line_long_words) >= 5 \
-                                and self.is_float(report_line_long_words[3]):
-                            class_name = self.get_class_name(report_line_long_words[0])
-
-                            if class_name not in ("NONE", "Other", "Idle"):
-                                if event_class_wait_sum.get(class_name, -1) >= 0:
-                                    event_class_wait_sum[class_name] += float(report_line_long_words[3].replace("," ,""))
-                                else:
-                                    event_class_wait_sum[class_name] = float(report_line_long_words[3].replace(",", ""))
-
-                        elif db_version < "11.2.0.3.0" and report_line.find("Wait Event Histogram") >= 0 \
-                                and wait_class_section:
-                            wait_class_section = False
-
-                            for class_name in self.event_classes:
-                                snap_data[date][class_name] = event_class_wait_sum.get(class_name, 0)
-
-                        elif report_line.find("SQL ordered by Elapsed Time") >= 0 and not top_sql_ela_ignore:
-                            top_sql_ela = True
-
-                        elif top_sql_ela and len(report_line_words) == 7 and len(report_line_words[6]) == 13 \
-                                and report_line_words[6][0] != '-' and self.is_float(report_line_words[0]):
-
-                            snap_data_sql_ela[date][report_line_words[6]] = float(report_line_words[0].replace(",", ""))
-                            if sql_ids.get(report_line_words[6]) is None:
-                                sql_ids[report_line_words[6]] = float(report_line_words[0].replace(",", ""))
-                            else:
-                                sql_ids[report_line_words[6]] += float(report_line_words[0].replace(",", ""))
-
-                        elif top_sql_ela:
-                            if report_line.find("SQL ordered by") >= 0 and top_sql_ela:
-                                top_sql_ela = False
-                                top_sql_ela_ignore = True
-
-                    except BaseException as e:
-                        print(e)
-                        print(report_line)
-                        print(fname)
-                        print("version = " + db_version)
-                        raise
-
-        data_x = sorted(snap_data.keys())
-        data_y = {}
-        data_y_profile_sec = {}
-        data_y_profile_mb = {}
-        data_y_profile_blk = {}
-        data_y_profile_num = {}
-        data_y_cpu = {}
-        data_y_sql_ela = {}
-        data_y_inst_stats = {}
-        data_y_time_model = {}
-        data_y_io_avg = {}
-
-        sql_ela_ns = []
-        for sqlid in sql_ids:
-            sql_ela_ns.append([sql_ids[sqlid], sqlid])
-
-        sql_ela_s = sorted(sql_ela_ns)
-        sql_ela_top = sql_ela_s[-20:]
-        # sql_ela_top = sql_ela_s
-        sql_ela_top_dict = {}
-        for se in sql_ela_top:
-            sql_ela_top_dict[se[1]] = se[0]
-
-        for i in snap_data_sql_ela:
-            for sqlid in sql_ids:
-                if snap_data_sql_ela[i].get(sqlid) is None:
-                    snap_data_sql_ela[i][sqlid] = 0
-                if sqlid not in sql_ela_top_dict:
-                    del snap_data_sql_ela[i][sqlid]
-
-        for i in data_x:
-            for j in snap_data_profile[i]:
-                if j in self.load_profile_sec:
-                    data_y_profile_sec.setdefault(j, [])
-                    data_y_profile_sec[j].append(snap_data_profile[i][j])
-                elif j in self.load_profile_mb:
-                    data_y_profile_mb.setdefault(j, [])
-                    data_y_profile_mb[j].append(snap_data_profile[i][j])
-                elif j in self.load_profile_blk:
-                    data_y_profile_blk.setdefault(j, [])
-                    data_y_profile_blk[j].append(snap_data_profile[i][j])
-                elif j in self.load_profile_num:
-                    data_y_profile_num.setdefault(j, [])
-                    data_y_profile_num[j].append(snap_data_profile[i][j])
-
-            for j in snap_data[i]:
-                data_y.setdefault(j, [])
-                data_y[j].append(snap_data[i][j])
-
-            for j in snap_data_cpu[i]:
-                data_y_cpu.setdefault(j, [])
-                data_y_cpu[j].append(snap_data_cpu[i][j])
-
-            for j in snap_data_sql_ela[i]:
-                data_y_sql_ela.setdefault(j, [])
-                data_y_sql_ela[j].append(snap_data_sql_ela[i][j])
-
-            for j in snap_data_inst_stats[i]:
-                data_y_inst_stats.setdefault(j, [])
-                data_y_inst_stats[j].append(snap_data_inst_stats[i][j])
-
-            for j in snap_data_time_model[i]:
-                data_y_time_model.setdefault(j, [])
-                data_y_time_model[j].append(snap_data_time_model[i][j])
-
-            for j in snap_data_io_avg[i]:
-                data_y_io_avg.setdefault(j, [])
-                data_y_io_avg[j].append(snap_data_io_avg[i][j])
-
+                    selected = set(self.select_report_files(report_files)) if report_files else set()
+                except Exception:
+                    continue
+
+                # a report deleted or rotated away takes its snapshots with it
+                changed = False
+                for fname in [fname for fname in seen if states.get(fname) is None]:
+                    del seen[fname]
+                    if snaps.pop(fname, None):
+                        changed = True
+
+                for fname in report_files:
+                    file_state = self.get_file_state(fname)
+                    file_snaps = []
+                    if file_state is None:
+                        continue
+                    if fname in selected:
+                        try:
+                            file_snaps = self.parse_file(fname)
+                        except Exception:
+                            continue
+                        if any(snap["date"] is None for snap in file_snaps):
+                            continue
+                        file_snaps = [snap for snap in file_snaps if self.is_selected(snap)]
+
+                    seen[fname] = file_state
+                    if not file_snaps and not snaps.get(fname):
+                        continue
+
+                    snaps[fname] = file_snaps
+                    changed = True
+                    if self.timings:
+                        print("parsed " + fname)
+
+                if changed:
+                    self.merge_snaps(series, snaps, merged)
+                    last_change = time.time()
+                if last_change is not None and time.time() - last_change >= debounce:
+                    if series.rows:
+                        self.render(series, auto_open=False)
+                    last_change = None
+        except KeyboardInterrupt:
+            pass
+
+    def merge_snaps(self, series, snaps, merged):
+        # Brings series in line with the records of snaps, {file name: records}, that are left after resolving
+        # overlaps. merged holds the records in series by id().
+        kept = self.resolve_overlaps([snap for file_snaps in snaps.values() for snap in file_snaps])
+        kept_ids = set(id(snap) for snap in kept)
+        for snap_id in list(merged):
+            if snap_id not in kept_ids:
+                self.remove_snap(series, merged.pop(snap_id))
+        for snap in kept:
+            if id(snap) not in merged:
+                merged[id(snap)] = snap
+                self.add_snap(series, snap)
+
+    def get_file_state(self, fname):
+        # None for a file that is gone
+        try:
+            stat = os.stat(os.path.join(self.dirname, fname))
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def new_series(self):
+        return MetricStore()
+
+    def add_snap(self, series, snap):
+        series.add(snap)
+        if snap["cpu_count"] is not None:
+            self.cpu_count = snap["cpu_count"]
+
+    def remove_snap(self, series, snap):
+        series.remove(snap)
+
+    def get_scale(self, series, keys):
+        # what wait class times are divided by: DB Time, the snapshot interval (giving the average number of
+        # sessions waiting) or the number of transactions in it
+        if self.scale == "sec":
+            return series.get_elapsed(keys)
+        elif self.scale == "txn":
+            return series.get_column("profile", "Transactions", keys) * series.get_elapsed(keys)
+        return series.get_column("profile", "DB Time", keys)
+
+    def get_x(self, labels, times, rows=None):
+        # compact charts are drawn on a date axis, the x are the times in milliseconds
+        if self.compact:
+            return typed_array((times if rows is None else times[rows]) * 1000.0, rtol=0)
+        if rows is None:
+            return labels
+        return [labels[i] for i in rows.tolist()]
+
+    def get_values(self, column):
+        if self.compact:
+            return typed_array(column)
+        return column.tolist()
+
+    def get_trace(self, webgl, stacks, **trace):
+        # Past webgl_points points a trace is drawn with WebGL, without markers. Its stacked traces are running
+        # totals instead, filled to the trace before in the same stack, the first one to zero. stacks holds the
+        # stack groups that already have a trace.
+        if not webgl:
+            trace["type"] = "scatter"
+            return trace
+
+        trace["type"] = "scattergl"
+        trace["mode"] = "lines"
+        stackgroup = trace.pop("stackgroup", None)
+        if stackgroup is not None:
+            trace["fill"] = "tonexty" if stackgroup in stacks else "tozeroy"
+            stacks.add(stackgroup)
+        return trace
+
+    def render(self, series, auto_open=True):
+        # Charts every view of param, e.g. FULL,SQL,IO, from one pass over series. With more than one job the
+        # views are built and written in parallel.
+        chart_data = self.get_chart_data(series)
+        views = self.param.split(",")
+        if self.jobs > 1 and len(views) > 1:
+            pool = multiprocessing.Pool(min(self.jobs, len(views)))
+            try:
+                pool.map(functools.partial(self.render_view, chart_data=chart_data, auto_open=auto_open), views)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for view in views:
+                self.render_view(view, chart_data, auto_open)
+
+    def get_chart_data(self, series):
+        # Returns the x labels, {series name: {metric: (x, y, instance)}}, whether some traces miss some of the labels
+        # (downsampled or charted per instance) and whether they are drawn with WebGL, shared by all views
+        snap_keys = series.get_keys()
+        data_x = snap_labels(snap_keys)
+        waits_metrics, waits = series.get_matrix("waits", snap_keys)
         if self.scale:
-            for series in data_y:
-                for x in range(len(data_y[series])):
-                    # print(series, x, round(data_y[series][x],2), data_y_profile_sec["DB Time"][x])
-                    data_y[series][x] = data_y[series][x] / data_y_profile_sec["DB Time"][x]
-
-        if self.param == 'FULL':
-
-            fig = make_subplots(rows=10, cols=1, shared_xaxes=True, subplot_titles=("Wait Event Class & DB Time (sec)",
-                                                                                   "Load Profile (DB/CPU)",
-                                                                                   "TOP SQL by Elapsed time",
-                                                                                   "Time Model",
-                                                "I/O Requests, Calls, Parses, Logons, SQL Executes, Rollbacks, Transactions, Sessions",
-                                                "Host CPU Average Load",
-                                                "Instance stats / s",
-                                                "Load Profile (I/O R/W, Redo, SQL Workarea)",
-                                                "Logical/Physical Reads/Writes, Block changes",
-                                                "AVG User I/O (ms)"
-                                                ))
-
-            fig['layout']['yaxis1'].update(title='sec')
-            fig['layout']['yaxis2'].update(title='sec/s')
-            fig['layout']['yaxis3'].update(title='sec')
-            fig['layout']['yaxis4'].update(title='sec')
-            fig['layout']['yaxis5'].update(title='#/s')
-            fig['layout']['yaxis6'].update(title='%')
-            fig['layout']['yaxis7'].update(title='#/s')
-            fig['layout']['yaxis8'].update(title='MB/s')
-            fig['layout']['yaxis9'].update(title='#blk/s')
-            fig['layout']['yaxis10'].update(title='AVG ms / snap')
-
-            fig['layout'].update(title='AWR ' + data_x[0] + " - " + data_x[-1] + " CPUs: " + str(self.cpu_count))
-
-            for series in data_y:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            #stackgroup='waits',
-                                            ), 1, 1)
-
-            for series in data_y_profile_sec:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_sec[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 2, 1)
-            for series in data_y_sql_ela:
-                fig.add_trace(go.Scatter(x=data_x,
-                                            #fill="tozeroy",
-                                            y=data_y_sql_ela[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            #visible="legendonly",
-                                            ), 3, 1)
-
-            for series in data_y_time_model:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_time_model[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 4, 1)
-
-            for series in data_y_profile_num:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_num[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 5, 1)
-
-            for series in data_y_cpu:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_cpu[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            stackgroup='cpu',
-                                            ), 6, 1)
-
-            for series in data_y_inst_stats:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_inst_stats[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 7, 1)
-
-            for series in data_y_profile_mb:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_mb[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 8, 1)
-
-            for series in data_y_profile_blk:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_blk[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 9, 1)
-
-            for series in data_y_io_avg:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            #fill="tozeroy",
-                                            y=data_y_io_avg[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 10, 1)
-
-
-
-            #fig.update_xaxes(showticklabels=False)
-            fig.update_layout(height=1500)
-
-        elif self.param == 'SQL':
-            fig = make_subplots(rows=4, cols=1, shared_xaxes=True, subplot_titles=("Wait Event Class & DB Time (sec)",
-                                                                                   "Load Profile (DB/CPU)",
-                                                                                   "TOP SQL Ela (sec)"
-                                                                                   "SQL box plots"
-                                                                                   ))
-
-            fig['layout']['yaxis1'].update(title='sec')
-            fig['layout']['yaxis2'].update(title='sec/s')
-            fig['layout']['yaxis3'].update(title='sec')
-
-            fig['layout'].update(title='AWR ' + data_x[0] + " - " + data_x[-1] + " CPUs: " + str(self.cpu_count))
-
-            for series in data_y:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            #stackgroup='waits',
-                                            ), 1, 1)
-
-            for series in data_y_profile_sec:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_sec[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 2, 1)
-
-            for series in data_y_sql_ela:
-                fig.add_trace(go.Scatter(x=data_x,
-                                            #fill="tozeroy",
-                                            y=data_y_sql_ela[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            #visible="legendonly",
-                                            ), 3, 1)
-
-
-        elif self.param == 'IO':
-
-            fig = make_subplots(rows=8, cols=1, shared_xaxes=True, subplot_titles=("Wait Event Class & DB Time (sec)",
-                                                                                   "Load Profile (DB/CPU)",
-                                                                                   "AVG User I/O (ms)",
-                                                "I/O Requests, Calls, Parses, Logons, SQL Executes, Rollbacks, Transactions, Sessions",
-                                                "Host CPU Average Load",
-                                                "Instance stats / s",
-                                                "Load Profile (I/O R/W, Redo, SQL Workarea)",
-                                                "Logical/Physical Reads/Writes, Block changes"
-                                                ))
-
-            fig['layout']['yaxis1'].update(title='sec')
-            fig['layout']['yaxis2'].update(title='sec/s')
-            fig['layout']['yaxis3'].update(title='AVG ms / snap')
-            fig['layout']['yaxis4'].update(title='#/s')
-            fig['layout']['yaxis5'].update(title='%')
-            fig['layout']['yaxis6'].update(title='#/s')
-            fig['layout']['yaxis7'].update(title='MB/s')
-            fig['layout']['yaxis8'].update(title='#blk/s')
-
-            fig['layout'].update(title='AWR ' + data_x[0] + " - " + data_x[-1] + " CPUs: " + str(self.cpu_count))
-
-            for series in data_y:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            #stackgroup='waits',
-                                            ), 1, 1)
-
-            for series in data_y_profile_sec:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_sec[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 2, 1)
-
-            for series in data_y_io_avg:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            #fill="tozeroy",
-                                            y=data_y_io_avg[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 3, 1)
-
-            for series in data_y_profile_num:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_num[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 4, 1)
-
-            for series in data_y_cpu:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_cpu[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            stackgroup='cpu',
-                                            ), 5, 1)
-
-            for series in data_y_inst_stats:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_inst_stats[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 6, 1)
-
-            for series in data_y_profile_mb:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_mb[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 7, 1)
-
-            for series in data_y_profile_blk:
-                fig.append_trace(go.Scatter(x=data_x,
-                                            fill="tozeroy",
-                                            y=data_y_profile_blk[series],
-                                            name=series,
-                                            mode='lines+markers',
-                                            line=dict(shape='hv'),
-                                            ), 8, 1)
-
-
-
-            #fig.update_xaxes(showticklabels=False)
-            #fig.update_layout(height=1500)
-
-
-
-        py.plot(fig, filename=self.name_pattern + ".html")
+            waits = divide(waits, self.get_scale(series, snap_keys)[:, np.newaxis])
+
+        inst_stats_metrics, inst_stats = series.get_matrix("inst_stats", snap_keys)
+        if "user commits/calls" in inst_stats_metrics:
+            commits = inst_stats[:, inst_stats_metrics.index("user commits")]
+            calls = inst_stats[:, inst_stats_metrics.index("user calls")]
+            # 0 unless there were fewer commits than calls
+            inst_stats[:, inst_stats_metrics.index("user commits/calls")] = \
+                np.where(commits < calls, divide(commits, calls), 0)
+
+        # top_sql SQL with the highest elapsed time summed over all snapshots (ties go to the higher sql_id)
+        sql_ids = series.sql_ids
+        sql_ela_top = set(heapq.nlargest(self.top_sql, sql_ids, key=lambda sqlid: (sql_ids[sqlid], sqlid)))
+
+        # top SQL of the first snapshot in its order, then the others in the order they were first seen
+        sql_ela_metrics = [sqlid for sqlid in series.get_metrics("sql_ela", snap_keys[:1]) if sqlid in sql_ela_top]
+        sql_ela_metrics += [sqlid for sqlid in sql_ids if sqlid in sql_ela_top and sqlid not in sql_ela_metrics]
+
+        matrices = {"waits": (waits_metrics, waits),
+                    "cpu": series.get_matrix("cpu", snap_keys),
+                    "inst_stats": (inst_stats_metrics, inst_stats),
+                    "time_model": series.get_matrix("time_model", snap_keys),
+                    "io_avg": series.get_matrix("io_avg", snap_keys),
+                    "profile": series.get_matrix("profile", snap_keys),
+                    "sql_ela": series.get_matrix("sql_ela", snap_keys, sql_ela_metrics, 0)}
+        times = series.get_times(snap_keys)
+        if self.bucket is not None:
+            data_x, times, boundaries = get_buckets(times, self.bucket)
+            for group, (metrics, matrix) in matrices.items():
+                how = "mean" if group == "waits" and self.scale else BUCKET_AGGREGATES[group]
+                matrices[group] = (metrics, aggregate(matrix, boundaries, how,
+                                                      [METRIC_AGGREGATES.get(metric) for metric in metrics]))
+
+        # Reports of several instances (or databases) are charted as traces of their own for every instance, so a
+        # trace does not zigzag between them. Buckets add the instances up, or average them, instead.
+        instances = [("", None)]
+        if self.bucket is None:
+            instance_rows = {}
+            for row, key in enumerate(snap_keys):
+                instance_rows.setdefault((key.dbid, key.inst_num), []).append(row)
+            if len(instance_rows) > 1:
+                several_dbs = len({dbid for dbid, inst_num in instance_rows}) > 1
+                instances = [(" %d/%d" % (dbid, inst_num) if several_dbs else " inst %d" % inst_num,
+                              np.array(rows, dtype=np.intp))
+                             for (dbid, inst_num), rows in sorted(instance_rows.items())]
+
+        points = max(len(data_x) if rows is None else len(rows) for suffix, rows in instances)
+        downsample = self.max_points is not None and points > self.max_points
+        webgl = min(points, self.max_points or points) > self.webgl_points
+        if webgl:
+            # WebGL traces cannot be stacked, the CPU traces are charted as running totals filled to the one
+            # before instead
+            cpu_metrics, cpu = matrices["cpu"]
+            stacked = np.nancumsum(cpu, axis=1)
+            stacked[np.isnan(cpu)] = NAN
+            matrices["cpu"] = (cpu_metrics, stacked)
+
+        # {metric: (x, y, instance)}, the x differ between the traces when they are downsampled or of different
+        # instances. instance is the suffix of the instance's trace names, "" for a single instance.
+        xs = [None if downsample else self.get_x(data_x, times, rows) for suffix, rows in instances]
+        data = {}
+        for group, (metrics, matrix) in matrices.items():
+            data[group] = {}
+            for (suffix, rows), x in zip(instances, xs):
+                instance_matrix = matrix if rows is None else matrix[rows]
+                if downsample:
+                    selected = lttb(instance_matrix, self.max_points)
+                    if rows is not None:
+                        selected = rows[selected]
+                    for j, metric in enumerate(metrics):
+                        data[group][metric + suffix] = (self.get_x(data_x, times, selected[:, j]),
+                                                        self.get_values(matrix[selected[:, j], j]), suffix)
+                else:
+                    for j, metric in enumerate(metrics):
+                        data[group][metric + suffix] = (x, self.get_values(instance_matrix[:, j]), suffix)
+
+        data["profile_sec"] = {}
+        data["profile_mb"] = {}
+        data["profile_blk"] = {}
+        data["profile_num"] = {}
+        for j in matrices["profile"][0]:
+            if j in self.load_profile_sec:
+                profile_group = data["profile_sec"]
+            elif j in self.load_profile_mb:
+                profile_group = data["profile_mb"]
+            elif j in self.load_profile_blk or j in self.load_profile_blk_old:
+                profile_group = data["profile_blk"]
+            elif j in self.load_profile_num:
+                profile_group = data["profile_num"]
+            else:
+                continue
+            for suffix, rows in instances:
+                profile_group[j + suffix] = data["profile"][j + suffix]
+
+        if len(instances) > 1:
+            # the instances share the labels of the snapshots they have in common
+            data_x = list(dict.fromkeys(data_x))
+        return data_x, data, downsample or len(instances) > 1, webgl
+
+    def get_chart_file(self, view):
+        # one view is written to <name_pattern>.html as always, several to <name_pattern>_<view>.html
+        if "," in self.param:
+            return self.name_pattern + "_" + view + ".html"
+        return self.name_pattern + ".html"
+
+    def render_view(self, view, chart_data, auto_open=True):
+        # plotly takes longer to import than most runs take to parse, so only rendering imports it
+        import plotly.offline as py
+        from plotly.subplots import make_subplots
+
+        data_x, data, partial, webgl = chart_data
+        # The traces are put together as plain dicts and the figure is written without validating them again,
+        # only the subplot layout comes from make_subplots
+        figure_start = time.time()
+        view_name, view = view, VIEWS[view]
+        traces = []
+        stacks = set()
+        for row, name, yaxis_title, trace_options in view["panels"]:
+            axis = "" if row == 1 else str(row)
+            for series, (x, y, instance) in data[name].items():
+                options = trace_options
+                if "stackgroup" in options:
+                    # every instance is a stack of its own
+                    options = dict(options, stackgroup=options["stackgroup"] + instance)
+                traces.append(self.get_trace(webgl, stacks,
+                                             x=x,
+                                             y=y,
+                                             name=series,
+                                             mode='lines+markers',
+                                             line=dict(shape='hv'),
+                                             xaxis="x" + axis,
+                                             yaxis="y" + axis,
+                                             **options))
+
+        fig = make_subplots(rows=view["rows"], cols=1, shared_xaxes=True, subplot_titles=view["titles"])
+        for row, name, yaxis_title, trace_options in view["panels"]:
+            fig['layout']['yaxis' + str(row)].update(title=yaxis_title)
+        fig['layout'].update(title='AWR ' + data_x[0] + " - " + data_x[-1] + " CPUs: " + str(self.cpu_count))
+        if view["height"] is not None:
+            fig.update_layout(height=view["height"])
+        if self.compact:
+            fig.update_xaxes(type="date")
+        elif partial:
+            # keep the category axis in time order, as traces no longer have a value for every snapshot
+            fig.update_xaxes(categoryorder="array", categoryarray=data_x)
+
+        fig = {"data": traces, "layout": fig.layout.to_plotly_json()}
+        if self.timings:
+            print("built the %s figure of %d traces in %.2fs" % (view_name, len(traces), time.time() - figure_start))
+
+        py.plot(fig, filename=self.get_chart_file(view_name), auto_open=auto_open, validate=False,
+                include_plotlyjs=self.plotlyjs)
+
+
+def param_type(param):
+    views = param.split(",")
+    if all(view in VIEWS for view in views) and len(set(views)) == len(views):
+        return param
+    raise argparse.ArgumentTypeError("expected FULL, SQL, IO or a list of them like FULL,SQL,IO, got " + repr(param))
+
+
+def snap_time_type(value):
+    for time_format in (SNAP_TIME_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, time_format).strftime(SNAP_TIME_FORMAT)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError("expected YYYY-MM-DD [HH:MM[:SS]], got " + repr(value))
 
 
 if __name__ == '__main__':
-    if len(sys.argv) == 3:
-        aa = AWRAnalyzer(sys.argv[1], sys.argv[2])
-        aa.plot()
-    elif len(sys.argv) == 4 and (sys.argv[3] == 'SQL' or sys.argv[3] == 'IO' or sys.argv[3].startswith('CLASS:')):
-        aa = AWRAnalyzer(sys.argv[1], sys.argv[2], sys.argv[3])
-        aa.plot()
-
-    elif len(sys.argv) == 5 and (sys.argv[3] == 'SQL' or sys.argv[3] == 'IO') and sys.argv[4] == 'scale':
-        aa = AWRAnalyzer(sys.argv[1], sys.argv[2], sys.argv[3], True)
-        aa.plot()
-
+    parser = argparse.ArgumentParser(description="This script by Kamil Stawiarski (@ora600pl) is to help you with "
+                                                 "visualizing data from multiple awr text reports. Special thanks to "
+                                                 "Piotr Wrzosek (@pewu78) for improving the charting layout",
+                                     epilog="You have to install plotly and numpy first [pip install plotly numpy]. "
+                                            "Details can be found on this blog: blog.ora-600.pl "
+                                            "and GitHub: https://github.com/ora600pl/statspack_scripts")
+    parser.add_argument("dirname", nargs="?", help="/path/to/reports/")
+    parser.add_argument("name_pattern", nargs="?", help="pattern to filter reports by name")
+    parser.add_argument("param", nargs="?", default="FULL", type=param_type,
+                        help="FULL (default), SQL or IO, or a list of them like FULL,SQL,IO to write "
+                             "<name_pattern>_<view>.html for each from one parse")
+    parser.add_argument("scale", nargs="?", choices=["scale", "sec", "txn"],
+                        help="divide wait class times by DB Time (scale), by the snapshot interval in seconds (sec) "
+                             "or by the number of transactions (txn)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of processes parsing reports in parallel (0 = number of CPUs)")
+    parser.add_argument("--timings", action="store_true", help="print how long each processing step took")
+    parser.add_argument("--cache", metavar="FILE",
+                        help="keep parsed reports in FILE and parse only new or modified reports on the next run")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="keep running, look for new reports every SECONDS and update the charts")
+    parser.add_argument("--debounce", type=float, default=10, metavar="SECONDS",
+                        help="with --watch, update the charts once no report has changed for SECONDS (default 10)")
+    parser.add_argument("--catalog", metavar="FILE",
+                        help="keep the header (database, instance, snapshots) of every report in FILE, so the "
+                             "filters below do not have to read the reports again")
+    parser.add_argument("--from", dest="time_from", type=snap_time_type, metavar="TIME",
+                        help="only reports beginning at or after TIME (YYYY-MM-DD [HH:MM[:SS]])")
+    parser.add_argument("--to", dest="time_to", type=snap_time_type, metavar="TIME",
+                        help="only reports beginning before TIME (YYYY-MM-DD [HH:MM[:SS]])")
+    parser.add_argument("--dbid", help="only reports of this DBID")
+    parser.add_argument("--instance", help="only reports of this instance (name or number)")
+    parser.add_argument("--top-sql", type=int, default=20, metavar="K",
+                        help="chart the K SQL with the highest elapsed time (default 20)")
+    parser.add_argument("--bucket", choices=sorted(BUCKETS, key=BUCKETS.get),
+                        help="aggregate the snapshots by hour, day or week")
+    parser.add_argument("--max-points", type=int, metavar="N",
+                        help="downsample traces of more than N points (LTTB)")
+    parser.add_argument("--webgl-points", type=int, default=WEBGL_POINTS, metavar="N",
+                        help="draw traces of more than N points with WebGL (default %d)" % WEBGL_POINTS)
+    parser.add_argument("--compact", action="store_true",
+                        help="write the series as base64 float32/float64 arrays on a date axis (plotly.js 2.28 or "
+                             "later)")
+    parser.add_argument("--plotlyjs", choices=("inline", "directory", "cdn"), default="inline",
+                        help="embed plotly.js in every chart (default), share one plotly.min.js in the "
+                             "output directory or load it from the CDN")
+    parser.add_argument("--import-event-names", nargs=2, metavar=("CSV", "RELEASE"),
+                        help="add the wait classes of a V$EVENT_NAME CSV export (with a header line) to "
+                             "awr_event_classes.json as Oracle RELEASE, e.g. 19.0.0.0, and exit")
+    args = parser.parse_args()
+
+    if args.import_event_names:
+        print("%d new or reclassified events" % import_event_names(*args.import_event_names))
+        sys.exit(0)
+    if args.name_pattern is None:
+        parser.error("dirname and name_pattern are required")
+
+    aa = AWRAnalyzer(args.dirname, args.name_pattern, args.param, args.scale,
+                     args.jobs or os.cpu_count(), args.timings, args.cache, args.catalog, args.time_from,
+                     args.time_to, args.dbid, args.instance, args.top_sql, args.bucket, args.max_points,
+                     args.webgl_points, args.compact, True if args.plotlyjs == "inline" else args.plotlyjs)
+    if args.watch:
+        aa.watch(args.watch, args.debounce)
     else:
-        print("This script by Kamil Stawiarski (@ora600pl) is to help you with visualizing data from multiple "
-              "awr text reports. Special thanks to Piotr Wrzosek (@pewu78) for improving the charting layout")
-
-        print("Usage:")
-        print("python awr_analyzer.py /path/to/reports/ pattern_to_filter_reports_by_name {[TRUE] for reporting SQLids with wait class}")
-        print("You have to install plotly first [pip install plotly]\n")
-        print("Details can be found on this blog: blog.ora-600.pl "
-              "and GitHub: https://github.com/ora600pl/statspack_scripts")
         aa.plot()